@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Benchmark how the board-side code scales with the number of practices.
+
+Builds synthetic boards (see synthetic_board.py) of increasing size and runs
+the code that touches every item, in process and without a network:
+
+  fetch        fetch_practices, paging through the board. Queries are
+               answered by mock_monday.py's MockMonday, and each response
+               goes through a JSON round trip, as a real one is parsed.
+  extract      _get_practice_files (and so _extract_file_info) on every item
+  plan         plan_jobs and _jobs_needing_urls
+  resolve      resolve_job_urls, in batched assets queries
+  report       _record for every file, writing the CSV report
+  incremental  _incremental_practices against a snapshot of the series,
+               with 1% of the practices changed
+
+Each stage is timed, then run again under tracemalloc for the peak memory
+it allocates. Time per item should stay flat as the board grows. The Growth
+column compares it with the smallest board, and stages whose time per item
+more than doubles are flagged as likely quadratic.
+
+Usage:
+  python3 benchmarks/board_scaling.py --items 10000,25000,50000,100000
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from download_practices import MondayAPIClient, PracticeDownloader, ReportWriter  # noqa: E402
+from mock_monday import MockMonday  # noqa: E402
+from synthetic_board import generate_items  # noqa: E402
+
+# Series whose group holds the synthetic practices
+SERIES = "high_school_core"
+
+# Growth in time per item, relative to the smallest board, flagged as quadratic
+GROWTH_WARNING = 2.0
+
+
+class BoardClient(MondayAPIClient):
+    """A MondayAPIClient that answers queries from a MockMonday in memory."""
+
+    def __init__(self, mock: MockMonday):
+        super().__init__("benchmark")
+        self.mock = mock
+
+    def query(self, query: str, variables: Optional[Dict] = None) -> Dict:
+        data = self.mock.answer(query, variables or {}, "files.invalid")
+        return json.loads(json.dumps(data))
+
+
+def stages(downloader: PracticeDownloader, state: Dict) -> List[tuple]:
+    """The benchmarked stages, in order, as (name, setup, stage).
+
+    Stages read and extend ``state``. Setup, when there is any, runs first
+    and is not measured.
+    """
+
+    def fetch():
+        state["practices"] = downloader.fetch_practices()
+        state["numbered"] = list(enumerate(state["practices"], start=1))
+
+    def extract():
+        for practice in state["practices"]:
+            downloader._get_practice_files(practice)
+
+    def plan():
+        state["jobs"] = downloader.plan_jobs(state["numbered"])
+        downloader._jobs_needing_urls(state["jobs"])
+
+    def resolve():
+        downloader.resolve_job_urls(state["jobs"])
+
+    def report():
+        for job in state["jobs"]:
+            downloader._record(
+                job,
+                "downloaded",
+                "Downloaded",
+                job["filename"] or "N/A",
+                {
+                    "size": 524288,
+                    "sha256": "0" * 64,
+                    "verified": ["length"],
+                    "received": 524288,
+                    "duration": 0.25,
+                },
+            )
+        downloader.close_report()
+
+    def snapshot():
+        items = state["practices"]
+        state["snapshot"] = {
+            "group_id": downloader.group_id,
+            "synced_at": "2026-10-01T00:00:00+00:00",
+            "items": list(items),
+        }
+        state["changed"] = [dict(item, updated_at="2026-10-02T00:00:00Z") for item in items[::100]]
+        state["item_ids"] = [item["id"] for item in items]
+
+    def incremental():
+        downloader._incremental_practices(
+            state["snapshot"], downloader.group_id, state["changed"], state["item_ids"]
+        )
+
+    return [
+        ("fetch", None, fetch),
+        ("extract", None, extract),
+        ("plan", None, plan),
+        ("resolve", None, resolve),
+        ("report", None, report),
+        ("incremental", snapshot, incremental),
+    ]
+
+
+def run_stages(mock: MockMonday, output: Path, measure: Callable) -> Dict[str, float]:
+    """Run every stage on a fresh downloader, returning ``measure``'s result for each."""
+    downloader = PracticeDownloader(
+        "benchmark",
+        SERIES,
+        output_dir=str(output),
+        client=BoardClient(mock),
+        report=ReportWriter(output / "report.csv"),
+    )
+    results = {}
+    state = {}
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            for name, setup, stage in stages(downloader, state):
+                if setup:
+                    setup()
+                # Don't charge one stage for collecting another's garbage
+                gc.collect()
+                results[name] = measure(stage)
+    finally:
+        downloader.manifest.close()
+    return results
+
+
+def timed(stage: Callable) -> float:
+    """Run a stage, returning its duration in seconds."""
+    started = time.perf_counter()
+    stage()
+    return time.perf_counter() - started
+
+
+def peak_memory(stage: Callable) -> float:
+    """Run a stage under tracemalloc, returning its peak allocation in MB."""
+    tracemalloc.start()
+    try:
+        stage()
+        return tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the board-side code against growing boards")
+    parser.add_argument(
+        "--items",
+        default="10000,25000,50000,100000",
+        help="Comma-separated board sizes (default: 10000,25000,50000,100000)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic boards (default: 0)")
+    args = parser.parse_args()
+
+    try:
+        sizes = sorted(int(n) for n in args.items.split(","))
+    except ValueError:
+        parser.error(f"--items must be comma-separated numbers, got {args.items!r}")
+
+    baseline = {}
+    flagged = set()
+    print(f"{'Items':>8}  {'Stage':<12}{'Seconds':>9}{'µs/item':>9}{'Growth':>8}{'Peak MB':>9}")
+    for size in sizes:
+        mock = MockMonday(generate_items(size, [SERIES], args.seed))
+        with tempfile.TemporaryDirectory() as tmp:
+            durations = run_stages(mock, Path(tmp) / "time", timed)
+            peaks = run_stages(mock, Path(tmp) / "memory", peak_memory)
+
+        for name, seconds in durations.items():
+            per_item = seconds / size * 1_000_000
+            baseline.setdefault(name, per_item)
+            growth = per_item / baseline[name] if baseline[name] else 1.0
+            flag = ""
+            if growth > GROWTH_WARNING:
+                flag = "  !"
+                flagged.add(name)
+            print(
+                f"{size:>8}  {name:<12}{seconds:>9.3f}{per_item:>9.1f}{growth:>7.1f}x{peaks[name]:>9.1f}{flag}",
+                flush=True,
+            )
+
+    if flagged:
+        print(f"\n! Time per item more than {GROWTH_WARNING:g}x the smallest board's: {', '.join(sorted(flagged))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Benchmark a whole download run against a local mock of Monday.com.
+
+Starts benchmarks/mock_monday.py in a child process with a synthetic board,
+then runs download_practices.py against it, once per combination of
+``--workers`` and ``--engine``, each into a fresh output directory. Both run
+as separate processes, so the downloader's peak RSS is its own. Reports
+files/s, MB/s, the API calls the run made and the downloader's peak RSS.
+
+With ``--incremental SHARE`` both runs pass --incremental, and each is
+followed by a second, "sync" run into the same directory after that share of
+the board's items was marked as updated.
+
+Usage:
+  python3 benchmarks/end_to_end.py --practices 200 --workers 1,4,8 --latency-ms 50
+  python3 benchmarks/end_to_end.py --error-rate 0.05 --bandwidth-mbps 2 -- --segments 1
+  python3 benchmarks/end_to_end.py --practices 2000 --incremental 0.01
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import download_practices  # noqa: E402
+from mock_monday import add_server_arguments  # noqa: E402
+from synthetic_board import EXTENSIONS  # noqa: E402
+from write_path import free_port  # noqa: E402
+
+REPO = Path(__file__).resolve().parent.parent
+
+# Extensions of the files mock_monday.py serves, including those taken from
+# its URLs (.mp3 and .jpg) when a file's name has none
+MEDIA_SUFFIXES = {extension.lower() for extensions in EXTENSIONS.values() for extension in extensions if extension}
+
+
+def start_mock(args: argparse.Namespace, port: int) -> subprocess.Popen:
+    """Start the mock Monday.com in a child process and wait for it to listen."""
+    command = [
+        sys.executable, str(REPO / "benchmarks" / "mock_monday.py"),
+        "--port", str(port),
+        "--series", *args.series,
+        "--practices", str(args.practices),
+        "--file-size-kb", str(args.file_size_kb),
+        "--latency-ms", str(args.latency_ms),
+        "--bandwidth-mbps", str(args.bandwidth_mbps),
+        "--error-rate", str(args.error_rate),
+        "--api-error-rate", str(args.api_error_rate),
+        "--seed", str(args.seed),
+    ]
+    server = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            mock_stats(port)
+            return server
+        except OSError:
+            time.sleep(0.05)
+    server.kill()
+    raise Exception("Mock Monday.com did not start")
+
+
+def mock_stats(port: int) -> dict:
+    """Fetch the mock's counters."""
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/stats", timeout=1) as response:
+        return json.load(response)
+
+
+def touch_items(port: int, share: float) -> None:
+    """Have the mock mark a share of its items as updated now."""
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{port}/touch", data=json.dumps({"share": share}).encode(), method="POST"
+    )
+    with urllib.request.urlopen(request, timeout=10):
+        pass
+
+
+def run_downloader(command: list, port: int, output: str) -> dict:
+    """Run the downloader once against the mock, returning its measurements."""
+    before = mock_stats(port)
+    env = dict(os.environ, MONDAY_API_URL=f"http://127.0.0.1:{port}/v2")
+    started = time.perf_counter()
+    process = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL)
+    _, status, usage = os.wait4(process.pid, 0)
+    wall = time.perf_counter() - started
+
+    # Files the run wrote, not those already there from an earlier run
+    files = [
+        path for path in Path(output).rglob("*")
+        if path.is_file() and path.suffix.lower() in MEDIA_SUFFIXES and path.stat().st_mtime >= time.time() - wall
+    ]
+    size = sum(path.stat().st_size for path in files)
+    stats = mock_stats(port)
+
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = usage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+    return {
+        "exit": os.waitstatus_to_exitcode(status),
+        "wall": wall,
+        "files": len(files),
+        "mb": size / (1024 * 1024),
+        "api_calls": stats["api_requests"] - before["api_requests"],
+        "file_requests": stats["file_requests"] - before["file_requests"],
+        "peak_rss_mb": peak / (1024 * 1024),
+    }
+
+
+def run(args: argparse.Namespace, engine: str, workers: int) -> list:
+    """Run the downloader against a fresh mock, returning each run's measurements.
+
+    With ``--incremental`` the full run is followed by a sync run.
+    """
+    port = free_port()
+    server = start_mock(args, port)
+    try:
+        with tempfile.TemporaryDirectory() as output:
+            command = [
+                sys.executable, str(REPO / "download_practices.py"),
+                "--series", *args.series,
+                "--token", "benchmark",
+                "--output", output,
+                "--workers", str(workers),
+                "--engine", engine,
+                *(["--incremental"] if args.incremental is not None else []),
+                *args.downloader_args,
+            ]
+            results = [run_downloader(command, port, output)]
+            if args.incremental is not None:
+                touch_items(port, args.incremental)
+                results.append(run_downloader(command, port, output))
+    finally:
+        server.kill()
+        server.wait()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark whole download runs against a local mock of Monday.com",
+        epilog="Arguments after -- are passed to download_practices.py.",
+    )
+    parser.add_argument(
+        "--series",
+        nargs="+",
+        default=["high_school_core"],
+        help="Series to put on the board and download (default: high_school_core)",
+    )
+    parser.add_argument("--workers", default="1,4,8", help="Comma-separated worker counts (default: 1,4,8)")
+    parser.add_argument(
+        "--engine",
+        choices=["threads", "async", "both"],
+        default="both",
+        help="Download engine to measure (default: both)",
+    )
+    parser.add_argument(
+        "--incremental",
+        type=float,
+        metavar="SHARE",
+        help="Run with --incremental, then sync again after this share of items changed (e.g. 0.01)",
+    )
+    add_server_arguments(parser)
+    parser.add_argument("downloader_args", nargs="*", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    engines = ["threads", "async"] if args.engine == "both" else [args.engine]
+    if "async" in engines and download_practices.aiohttp is None:
+        engines.remove("async")
+        print("aiohttp not installed, skipping the async engine")
+
+    try:
+        worker_counts = [int(n) for n in args.workers.split(",")]
+    except ValueError:
+        parser.error(f"--workers must be comma-separated numbers, got {args.workers!r}")
+
+    print(
+        f"{'Engine':<13}{'Workers':>7}{'Files':>8}{'Seconds':>10}{'Files/s':>10}"
+        f"{'MB/s':>9}{'API calls':>11}{'GETs':>7}{'Peak RSS MB':>13}"
+    )
+    for engine in engines:
+        for workers in worker_counts:
+            for label, result in zip([engine, f"{engine} sync"], run(args, engine, workers)):
+                note = "" if result["exit"] == 0 else f"  (exit {result['exit']})"
+                print(
+                    f"{label:<13}{workers:>7}{result['files']:>8}{result['wall']:>10.2f}"
+                    f"{result['files'] / result['wall']:>10.1f}{result['mb'] / result['wall']:>9.1f}"
+                    f"{result['api_calls']:>11}{result['file_requests']:>7}{result['peak_rss_mb']:>13.1f}{note}",
+                    flush=True,
+                )
+
+
+if __name__ == "__main__":
+    main()
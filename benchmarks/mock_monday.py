@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+A local stand-in for Monday.com and its file host, for benchmarks.
+
+Answers the GraphQL queries MondayAPIClient sends (groups, items_page,
+next_items_page and assets) from a board built by synthetic_board.py, and
+serves synthetic MP3 and JPEG files for the asset URLs it hands out. File
+size, latency, per-connection bandwidth and error rates are configurable,
+and errors are drawn from a seeded random generator so runs can be
+repeated. Counters of what was served are available as JSON at ``/stats``.
+
+Point the downloader at it with the MONDAY_API_URL environment variable:
+
+  python3 benchmarks/mock_monday.py --port 8765 --practices 200
+  MONDAY_API_URL=http://127.0.0.1:8765/v2 python3 download_practices.py \\
+    --series high_school_core --token benchmark --workers 8
+
+Of the items_page filters (``query_params``), only the one incremental runs
+send is understood: items updated on or after a date. POST ``/touch`` with
+``{"share": 0.01}`` to mark a share of the items as updated now.
+"""
+
+import argparse
+import json
+import random
+import re
+import socket
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from download_practices import SERIES_MAP  # noqa: E402
+from synthetic_board import generate_items, item_files, items_page  # noqa: E402
+
+# Complexity reported for every query, high enough never to run out
+BUDGET = 10_000_000
+
+# Bytes written to the socket at a time when serving files
+SEND_SIZE = 64 * 1024
+
+
+class MockMonday:
+    """The GraphQL API and file host, served from one local HTTP server."""
+
+    def __init__(
+        self,
+        items: List[Dict],
+        file_size: int = 512 * 1024,
+        latency: float = 0.0,
+        bandwidth: float = 0.0,
+        error_rate: float = 0.0,
+        api_error_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        self.items = items
+        self.file_size = file_size
+        self.latency = latency  # Seconds before every response
+        self.bandwidth = bandwidth  # Bytes per second per connection, 0 for no limit
+        self.error_rate = error_rate  # Share of file requests that fail
+        self.api_error_rate = api_error_rate  # Share of API requests that fail
+        self.rng = random.Random(seed)
+        self.groups = {}  # Group ID to title
+        self.group_items = {}  # Group ID to its items, in board order
+        self.asset_kinds = {}
+        self._updated = {}  # (group ID, date) to the group's items updated since, in board order
+        for item in items:
+            self.groups.setdefault(item["group"]["id"], item["group"]["title"])
+            self.group_items.setdefault(item["group"]["id"], []).append(item)
+            for asset_id, kind in item_files(item):
+                self.asset_kinds[asset_id] = kind
+        self.bodies = {kind: self._body(kind) for kind in ("audio", "image")}
+        self.stats = {
+            "api_requests": 0,
+            "api_errors": 0,
+            "file_requests": 0,
+            "file_errors": 0,
+            "bytes_served": 0,
+        }
+        self._lock = threading.Lock()
+
+    def _body(self, kind: str) -> bytes:
+        """A synthetic file that starts like a real one of its kind."""
+        header = b"ID3\x04\x00\x00\x00\x00\x00\x00" if kind == "audio" else b"\xff\xd8\xff\xe0\x00\x10JFIF"
+        filler = random.Random(kind).randbytes(4096)
+        body = header + filler * (self.file_size // len(filler) + 1)
+        return body[:self.file_size]
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[key] += amount
+
+    def _fails(self, rate: float) -> bool:
+        with self._lock:
+            return self.rng.random() < rate
+
+    def touch(self, share: float) -> int:
+        """Mark a share of the items as updated now, returning how many."""
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        with self._lock:
+            touched = self.rng.sample(self.items, round(len(self.items) * share))
+            for item in touched:
+                item["updated_at"] = now
+            self._updated.clear()
+        return len(touched)
+
+    @staticmethod
+    def _updated_since(query_params: Optional[Dict]) -> str:
+        """The date of an "updated on or after" filter, or "" for none."""
+        for rule in (query_params or {}).get("rules", []):
+            if rule.get("column_id") == "__last_updated__" and rule.get("operator") == "greater_than_or_equals":
+                return rule["compare_value"][-1]
+        return ""
+
+    def _items(self, group_id: str, since: str) -> List[Dict]:
+        """A group's items, or the whole board's, updated on or after ``since``."""
+        items = self.group_items.get(group_id, []) if group_id else self.items
+        if not since:
+            return items
+        with self._lock:
+            if (group_id, since) not in self._updated:
+                self._updated[(group_id, since)] = [
+                    item for item in items if item["updated_at"][:10] >= since
+                ]
+            return self._updated[(group_id, since)]
+
+    def answer(self, query: str, variables: Dict, host: str) -> Dict:
+        """Build the ``data`` of a GraphQL response."""
+        if "assets(" in query:
+            return {"assets": [
+                {
+                    "id": str(asset_id),
+                    "name": f"asset_{asset_id}",
+                    "public_url": f"http://{host}/files/{asset_id}"
+                    + (".jpg" if self.asset_kinds.get(str(asset_id)) == "image" else ".mp3"),
+                }
+                for asset_id in variables["assetIds"]
+            ]}
+
+        if "items_page" not in query:
+            return {"boards": [{"groups": [
+                {"id": group_id, "title": title} for group_id, title in self.groups.items()
+            ]}]}
+
+        limit = variables.get("limit", 100)
+        if variables.get("cursor"):
+            # The cursor carries the first page's filter forward
+            group_id, since, offset = variables["cursor"].split("|")
+            offset = int(offset)
+        else:
+            # The client asks for one group at a time, or the whole board
+            group_id = (variables.get("groupId") or [""])[0]
+            since = self._updated_since(variables.get("queryParams"))
+            offset = 0
+
+        items = self._items(group_id, since)
+        page, next_offset = items_page(items, offset, limit, variables.get("columnIds"))
+        items_page_data = {
+            "cursor": f"{group_id}|{since}|{next_offset}" if next_offset is not None else None,
+            "items": page,
+        }
+
+        if "next_items_page" in query:
+            return {"next_items_page": items_page_data}
+        if "groups(ids" in query:
+            return {"boards": [{"groups": [{"items_page": items_page_data}]}]}
+        return {"boards": [{"items_page": items_page_data}]}
+
+    def handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status: int, body: bytes, content_type: str = "application/json") -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                if self.path == "/touch":
+                    touched = mock.touch(float(request.get("share", 0)))
+                    self._send(200, json.dumps({"touched": touched}).encode())
+                    return
+                mock._count("api_requests")
+                time.sleep(mock.latency)
+                if mock._fails(mock.api_error_rate):
+                    mock._count("api_errors")
+                    self._send(502, b"Bad gateway", "text/plain")
+                    return
+                data = mock.answer(request["query"], request.get("variables") or {}, self.headers["Host"])
+                data["complexity"] = {"before": BUDGET, "query": 1, "after": BUDGET - 1, "reset_in_x_seconds": 60}
+                self._send(200, json.dumps({"data": data, "account_id": 1}).encode())
+
+            def do_GET(self):
+                if self.path == "/stats":
+                    with mock._lock:
+                        self._send(200, json.dumps(mock.stats).encode())
+                    return
+
+                match = re.match(r"/files/(\d+)", self.path)
+                if not match:
+                    self._send(404, b"Not found", "text/plain")
+                    return
+                mock._count("file_requests")
+                asset_id = match.group(1)
+                body = mock.bodies[mock.asset_kinds.get(asset_id, "audio")]
+                time.sleep(mock.latency)
+
+                failure = mock._fails(mock.error_rate)
+                if failure and mock._fails(0.5):
+                    mock._count("file_errors")
+                    self.send_response(503)
+                    self.send_header("Retry-After", "0")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                etag = f'"{asset_id}-1"'
+                start, end = 0, len(body)
+                range_header = self.headers.get("Range")
+                if range_header and self.headers.get("If-Range", etag) == etag:
+                    first, last = range_header.split("=", 1)[1].split("-")
+                    start = int(first)
+                    end = int(last) + 1 if last else len(body)
+                    if start >= len(body):
+                        self.send_response(416)
+                        self.send_header("Content-Range", f"bytes */{len(body)}")
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes {start}-{end - 1}/{len(body)}")
+                else:
+                    self.send_response(200)
+                self.send_header("Content-Type", "image/jpeg" if body is mock.bodies["image"] else "audio/mpeg")
+                self.send_header("Content-Length", str(end - start))
+                self.send_header("Accept-Ranges", "bytes")
+                self.send_header("ETag", etag)
+                self.end_headers()
+
+                if failure:
+                    # Drop the connection halfway through the body
+                    end = start + (end - start) // 2
+                    self.close_connection = True
+                    mock._count("file_errors")
+                self._stream(memoryview(body)[start:end])
+                if failure:
+                    self.connection.shutdown(socket.SHUT_RDWR)
+
+            def _stream(self, view: memoryview) -> None:
+                """Send a body, paced to the per-connection bandwidth."""
+                started = time.perf_counter()
+                sent = 0
+                while sent < len(view):
+                    chunk = view[sent:sent + SEND_SIZE]
+                    self.wfile.write(chunk)
+                    sent += len(chunk)
+                    if mock.bandwidth:
+                        ahead = sent / mock.bandwidth - (time.perf_counter() - started)
+                        if ahead > 0:
+                            time.sleep(ahead)
+                mock._count("bytes_served", sent)
+
+        return Handler
+
+    def serve(self, port: int = 0) -> ThreadingHTTPServer:
+        """Start serving in a background thread, returning the server."""
+        server = ThreadingHTTPServer(("127.0.0.1", port), self.handler())
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+def add_server_arguments(parser: argparse.ArgumentParser) -> None:
+    """Options shared by this script and the benchmarks that launch it."""
+    parser.add_argument("--practices", type=int, default=200, help="Practices per series (default: 200)")
+    parser.add_argument("--file-size-kb", type=int, default=512, help="Size of every file (default: 512)")
+    parser.add_argument("--latency-ms", type=float, default=20, help="Delay before every response (default: 20)")
+    parser.add_argument(
+        "--bandwidth-mbps",
+        type=float,
+        default=0,
+        help="Per-connection bandwidth in MB/s, 0 for no limit (default: 0)",
+    )
+    parser.add_argument("--error-rate", type=float, default=0, help="Share of file requests that fail (default: 0)")
+    parser.add_argument(
+        "--api-error-rate", type=float, default=0, help="Share of API requests that fail (default: 0)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the board and injected errors (default: 0)")
+
+
+def from_arguments(args: argparse.Namespace, series: List[str]) -> MockMonday:
+    """Build a mock from the options added by add_server_arguments."""
+    return MockMonday(
+        generate_items(args.practices, series, args.seed),
+        file_size=args.file_size_kb * 1024,
+        latency=args.latency_ms / 1000,
+        bandwidth=args.bandwidth_mbps * 1024 * 1024,
+        error_rate=args.error_rate,
+        api_error_rate=args.api_error_rate,
+        seed=args.seed,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for Monday.com and its file host")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+    parser.add_argument(
+        "--series",
+        nargs="+",
+        default=list(SERIES_MAP),
+        help="Series keys to put on the board (default: all)",
+    )
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    mock = from_arguments(args, args.series)
+    server = mock.serve(args.port)
+    print(f"Serving {len(mock.items)} items at http://127.0.0.1:{server.server_address[1]}/v2", flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
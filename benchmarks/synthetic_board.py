@@ -0,0 +1,147 @@
+"""
+Synthetic Current Practices boards, for benchmarks.
+
+Builds board items shaped like Monday.com's items_page responses: one group
+per series, the five file columns with asset IDs, and a couple of other
+columns. Like the real board, some file cells are empty in each of the ways
+Monday.com leaves them (no column value, ``null``, an empty file list, a
+file without an asset ID), some names need _sanitize_filename's help, and
+some files are named without an extension or in capitals.
+
+Everything comes from a seeded random generator, so a board can be rebuilt
+exactly.
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from download_practices import FILE_COLUMNS, SERIES_MAP  # noqa: E402
+
+# Columns on the board besides the file columns; the downloader never asks for them
+OTHER_COLUMNS = [("status", "status", "Ready"), ("text_notes", "text", "Recorded in studio B")]
+
+# Practice themes, combined with a number into practice names
+THEMES = [
+    "Breathing", "Body Scan", "Kindness", "Gratitude", "Focus", "Listening",
+    "Calm Waters", "Mountain", "Letting Go", "Noticing Feelings",
+]
+
+# Names that put _sanitize_filename to work: reserved characters, runs of
+# spaces and underscores, accents, emoji, path separators and long names
+ODD_NAMES = [
+    'Kindness: "Me & You"',
+    "Body Scan / Part 2",
+    "  Leading and trailing spaces  ",
+    "What?*<Why>|",
+    "Café Calm – Día 3",
+    "Ocean Waves 🌊 for Sleep",
+    "Many   spaces___and__underscores",
+    "../../etc/passwd",
+    "C:\\Practices\\Old",
+    "",
+    "Long " + "very " * 40 + "long name",
+]
+
+# Extensions of the audio and image files, in rough order of frequency
+EXTENSIONS = {
+    "audio": [".mp3", ".mp3", ".mp3", ".MP3", ".m4a", ""],
+    "image": [".jpg", ".jpg", ".png", ".JPEG", ""],
+}
+
+# Values Monday.com returns for a file cell with no usable file
+EMPTY_VALUES = [None, "null", "{}", json.dumps({"files": []}), json.dumps({"files": [{"name": "lost.mp3"}]})]
+
+
+def generate_items(
+    practices: int,
+    series: List[str],
+    seed: int = 0,
+    missing_rate: float = 0.15,
+    odd_rate: float = 0.05,
+) -> List[Dict]:
+    """Build board items: ``practices`` per series key in ``series``.
+
+    About ``missing_rate`` of the file cells have no usable file, and about
+    ``odd_rate`` of the practices have an awkward name. Asset IDs are unique
+    across the board.
+    """
+    rng = random.Random(seed)
+    items = []
+    asset_id = 100_000_000
+    for group_index, key in enumerate(series):
+        group = {"id": f"new_group{group_index:05d}", "title": SERIES_MAP.get(key, key)}
+        for n in range(1, practices + 1):
+            if rng.random() < odd_rate:
+                name = rng.choice(ODD_NAMES)
+            else:
+                name = f"Practice {n}: {rng.choice(THEMES)}"
+
+            column_values = []
+            for column_id, column in FILE_COLUMNS.items():
+                if rng.random() < missing_rate:
+                    empty = rng.randrange(len(EMPTY_VALUES) + 1)
+                    if empty == len(EMPTY_VALUES):
+                        # The column is missing from the item altogether
+                        continue
+                    value = EMPTY_VALUES[empty]
+                else:
+                    files = []
+                    # Now and then a cell holds a second, older upload
+                    for _ in range(2 if rng.random() < 0.02 else 1):
+                        asset_id += 1
+                        extension = rng.choice(EXTENSIONS[column["kind"]])
+                        files.append({
+                            "name": f"{name} {column['name']}{extension}",
+                            "assetId": asset_id,
+                            "isImage": str(column["kind"] == "image").lower(),
+                            "fileType": "ASSET",
+                        })
+                    value = json.dumps({"files": files})
+                column_values.append({"id": column_id, "value": value, "text": "", "type": "file"})
+
+            for column_id, column_type, text in OTHER_COLUMNS:
+                column_values.append({
+                    "id": column_id, "value": json.dumps(text), "text": text, "type": column_type
+                })
+
+            items.append({
+                "id": str(5_000_000_000 + len(items)),
+                "name": name,
+                "updated_at": f"2026-{rng.randint(1, 9):02d}-{rng.randint(1, 28):02d}T12:00:00Z",
+                "group": dict(group),
+                "column_values": column_values,
+            })
+    return items
+
+
+def item_files(item: Dict) -> Iterator[Tuple[str, str]]:
+    """Yield (asset ID, kind) for each file on a board item."""
+    for column in item["column_values"]:
+        if column["id"] not in FILE_COLUMNS or not column["value"]:
+            continue
+        data = json.loads(column["value"])
+        for file in (data or {}).get("files", []):
+            if file.get("assetId"):
+                yield str(file["assetId"]), FILE_COLUMNS[column["id"]]["kind"]
+
+
+def items_page(
+    items: List[Dict], offset: int, limit: int, column_ids: Optional[List[str]] = None
+) -> Tuple[List[Dict], Optional[int]]:
+    """Return one page of items and the offset of the next page, or None after the last.
+
+    Only the columns in ``column_ids`` are kept when it is given, as
+    items_page's column_values(ids:) does.
+    """
+    page = items[offset:offset + limit]
+    if column_ids is not None:
+        page = [
+            dict(item, column_values=[c for c in item["column_values"] if c["id"] in column_ids])
+            for item in page
+        ]
+    return page, offset + limit if offset + limit < len(items) else None
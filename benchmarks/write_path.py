@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark the download write path.
+
+Serves a large file from a local HTTP server in a separate process and
+downloads it repeatedly through PracticeDownloader's single-attempt
+download methods, reporting throughput (MB/s) and the downloader's CPU
+time per GB. Run it before and after changing the write path to compare.
+
+Usage:
+  python3 benchmarks/write_path.py --size-mb 256 --repeat 4
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import download_practices  # noqa: E402
+from download_practices import PracticeDownloader  # noqa: E402
+
+
+def free_port() -> int:
+    """Find a free TCP port on localhost."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(directory: Path, port: int) -> subprocess.Popen:
+    """Serve a directory over HTTP in a child process, so its CPU isn't counted."""
+    server = subprocess.Popen(
+        [sys.executable, "-m", "http.server", str(port), "--bind", "127.0.0.1",
+         "--directory", str(directory)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return server
+        except OSError:
+            time.sleep(0.05)
+    server.kill()
+    raise Exception("Benchmark server did not start")
+
+
+def run(downloader: PracticeDownloader, engine: str, url: str, target: Path, repeat: int) -> tuple:
+    """Download the file ``repeat`` times, returning (bytes, wall seconds, CPU seconds)."""
+    total = 0
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+
+    if engine == "async":
+        async def download_all() -> int:
+            async with download_practices.aiohttp.ClientSession() as session:
+                size = 0
+                for n in range(repeat):
+                    result = await downloader._fetch_file_async(session, url, target, n)
+                    size += result["size"]
+                    target.unlink()
+                return size
+
+        total = asyncio.run(download_all())
+    else:
+        for n in range(repeat):
+            total += downloader._fetch_file(url, target, n)["size"]
+            target.unlink()
+
+    return total, time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the download write path")
+    parser.add_argument("--size-mb", type=int, default=256, help="Size of the test file (default: 256)")
+    parser.add_argument("--repeat", type=int, default=4, help="Downloads per engine (default: 4)")
+    parser.add_argument(
+        "--engine",
+        choices=["threads", "async", "both"],
+        default="both",
+        help="Download path to measure (default: both)",
+    )
+    args = parser.parse_args()
+
+    engines = ["threads", "async"] if args.engine == "both" else [args.engine]
+    if "async" in engines and download_practices.aiohttp is None:
+        engines.remove("async")
+        print("aiohttp not installed, skipping the async engine")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        served = tmp / "served"
+        served.mkdir()
+        with open(served / "asset.mp3", "wb") as f:
+            block = os.urandom(1024 * 1024)
+            for _ in range(args.size_mb):
+                f.write(block)
+
+        port = free_port()
+        server = start_server(served, port)
+        try:
+            downloader = PracticeDownloader("benchmark", "benchmark", output_dir=str(tmp / "out"))
+            url = f"http://127.0.0.1:{port}/asset.mp3"
+            target = downloader.output_dir / "asset.mp3"
+
+            print(f"{'Engine':<10}{'MB/s':>10}{'CPU s/GB':>12}")
+            for engine in engines:
+                size, wall, cpu = run(downloader, engine, url, target, args.repeat)
+                mb = size / (1024 * 1024)
+                print(f"{engine:<10}{mb / wall:>10.1f}{cpu / (mb / 1024):>12.2f}")
+            downloader.manifest.close()
+        finally:
+            server.kill()
+
+
+if __name__ == "__main__":
+    main()
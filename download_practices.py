@@ -6,31 +6,231 @@ Download audio files from Monday.com Current Practices board by series.
 """
 
 import argparse
+import asyncio
+import base64
+import binascii
+import bisect
+import cProfile
+import ctypes
+import ctypes.util
+import errno
 import os
 import sys
 import re
 import json
 import csv
+import hashlib
+import pstats
+import queue
+import random
+import sqlite3
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from datetime import datetime
+from typing import AsyncIterator, BinaryIO, Dict, Iterator, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3
+
+try:
+    import aiohttp  # Only needed for --engine async
+except ImportError:
+    aiohttp = None
+
+try:
+    # Linux's fallocate, used to reserve disk space for downloads. The
+    # fallocate64 entry point takes 64-bit offsets on 32-bit systems too;
+    # plain fallocate only does where off_t is 64 bits wide.
+    _libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    try:
+        _fallocate = _libc.fallocate64
+    except AttributeError:
+        if ctypes.sizeof(ctypes.c_long) != 8:
+            raise
+        _fallocate = _libc.fallocate
+    _fallocate.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int64, ctypes.c_int64]
+    _fallocate.restype = ctypes.c_int
+except (OSError, AttributeError, TypeError):
+    _fallocate = None
 
 
 # Board configuration
 BOARD_ID = "18393634822"
 WORKSPACE_ID = "13709949"
-API_URL = "https://api.monday.com/v2"
+# MONDAY_API_URL points the client at another endpoint, such as the
+# benchmark mock in benchmarks/mock_monday.py
+API_URL = os.environ.get("MONDAY_API_URL", "https://api.monday.com/v2")
+
+# Maximum number of asset IDs sent in a single assets query
+ASSET_BATCH_SIZE = 50
 
-# File column IDs
+# Items requested per board page (Monday.com allows up to 500). Pages only
+# carry the file columns, so large pages stay well under the complexity cap.
+ITEMS_PAGE_LIMIT = 500
+
+# File column IDs, with the kind of file each holds (see FILE_SIGNATURES)
 FILE_COLUMNS = {
-    "file_mkza76s9": {"name": "Short_English", "type": "5min_EN"},
-    "file_mkzapzwb": {"name": "Short_Spanish", "type": "5min_ES"},
-    "file_mkzanc1b": {"name": "Long_English", "type": "10min_EN"},
-    "file_mkzacaj0": {"name": "Long_Spanish", "type": "10min_ES"},
-    "file_mkzan21e": {"name": "Cover_Photo", "type": "Cover"},
+    "file_mkza76s9": {"name": "Short_English", "type": "5min_EN", "kind": "audio"},
+    "file_mkzapzwb": {"name": "Short_Spanish", "type": "5min_ES", "kind": "audio"},
+    "file_mkzanc1b": {"name": "Long_English", "type": "10min_EN", "kind": "audio"},
+    "file_mkzacaj0": {"name": "Long_Spanish", "type": "10min_ES", "kind": "audio"},
+    "file_mkzan21e": {"name": "Cover_Photo", "type": "Cover", "kind": "image"},
+}
+
+# How each kind of file may start, as (offset, magic bytes). MP3s without
+# an ID3 tag start with an MPEG frame sync, which is checked separately.
+FILE_SIGNATURES = {
+    "audio": [(0, b"ID3"), (0, b"RIFF"), (0, b"fLaC"), (0, b"OggS"), (4, b"ftyp")],
+    "image": [(0, b"\xff\xd8\xff"), (0, b"\x89PNG\r\n\x1a\n"), (0, b"GIF8"), (0, b"RIFF")],
+}
+
+# Leading bytes of a download checked against FILE_SIGNATURES
+SNIFF_SIZE = 16
+
+# Manifest of downloaded assets, kept in the top-level output directory
+MANIFEST_FILENAME = ".download_manifest.sqlite3"
+
+# Snapshot of the series' board items, kept in each series directory
+SNAPSHOT_FILENAME = ".board_snapshot.json"
+
+# Suffix for files that are still downloading
+PART_SUFFIX = ".part"
+
+# Suffix for the sidecar recording which asset a partial file holds
+PART_INFO_SUFFIX = ".json"
+
+# Number of hosts each HTTP session keeps a connection pool for
+POOL_HOSTS = 4
+
+# Download jobs queued per worker before page fetching waits for them
+JOB_QUEUE_DEPTH = 4
+
+# Size of the blocks the async engine hands to a thread for writing
+ASYNC_WRITE_SIZE = 1024 * 1024
+
+# Smallest and largest reads from a download stream. Reads start small and
+# double while the stream keeps filling them, so fast transfers need few
+# Python-level iterations and write calls.
+READ_SIZE_MIN = 64 * 1024
+READ_SIZE_MAX = 1024 * 1024
+
+# fallocate() mode that reserves blocks without changing the file's size
+FALLOC_FL_KEEP_SIZE = 1
+
+# fallocate() errors that fail a download; any other just skips reserving space
+PREALLOCATE_FATAL_ERRNOS = {errno.ENOSPC, errno.EDQUOT}
+
+# Files at least this big are fetched as several byte ranges in parallel,
+# when the server accepts range requests
+SEGMENT_THRESHOLD = 8 * 1024 * 1024
+
+# Default number of byte ranges a large file is split into
+DOWNLOAD_SEGMENTS = 4
+
+# Length of Monday.com's complexity budget window, in seconds
+COMPLEXITY_WINDOW = 60
+
+# Times a query is retried after Monday.com rejects it for complexity
+COMPLEXITY_RETRIES = 3
+
+# Error codes Monday.com uses when the complexity budget is exhausted
+COMPLEXITY_ERROR_CODES = {"ComplexityException", "COMPLEXITY_BUDGET_EXHAUSTED"}
+
+# HTTP statuses that no retry will fix, such as a bad or revoked API token
+FATAL_STATUS_CODES = {401, 403}
+
+# HTTP statuses worth retrying: timeouts, rate limits and server errors
+RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+
+# Retries after a transient failure, and the backoff between them in seconds
+RETRY_ATTEMPTS = 5
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 60.0
+
+# HTTP statuses from a file host that suggest a signed download URL expired
+EXPIRED_URL_STATUS_CODES = {401, 403, 410}
+
+# Seconds to wait for Monday.com to answer a query
+API_TIMEOUT = 60
+
+# Seconds of traffic the bandwidth limiter lets through in one burst
+BANDWIDTH_BURST = 0.25
+
+# Seconds between checks of the --max-rate-file for a new rate
+RATE_FILE_POLL = 1.0
+
+# Multipliers for the units accepted by --max-rate
+RATE_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+# Response headers holding a base64 digest of the whole file, by algorithm
+CHECKSUM_HEADERS = {"x-amz-checksum-sha256": "sha256", "Content-MD5": "md5"}
+
+# Stages of a run timed for the summary's latency percentiles, with their labels
+TIMED_STAGES = {
+    "board_page": "Board page",
+    "url_resolve": "URL resolve",
+    "ttfb": "Time to first byte",
+    "transfer": "Transfer",
+    "disk_write": "Disk writes",
 }
 
+# Percentiles of each stage's durations shown in the summary
+TIMING_PERCENTILES = (50, 95, 99)
+
+# Phases of a run whose peak memory --profile mem reports, with their labels
+PROFILE_PHASES = {
+    "board_page": "Board pages",
+    "plan": "Planning",
+    "url_resolve": "URL resolution",
+    "download": "Downloads",
+}
+
+# Seconds between samples of thread stacks (--profile-stacks) and of
+# traced memory (--profile mem)
+PROFILE_SAMPLE_INTERVAL = 0.01
+
+# Functions listed by own CPU time at the end of a --profile cpu run
+PROFILE_TOP_FUNCTIONS = 10
+
+# Prefix of every exported metric name
+METRICS_PREFIX = "practice_downloader"
+
+# Upper bounds, in seconds, of the exported stage latency histogram buckets
+METRICS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Seconds between rewrites of the --metrics-file while a run is going
+METRICS_INTERVAL = 15
+
+# Content types of the two metrics exposition formats
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Columns of the CSV download report
+REPORT_FIELDS = [
+    "Series",
+    "Practice Number",
+    "Practice Name",
+    "File Type",
+    "Original Filename (Monday.com)",
+    "Downloaded Filename",
+    "Status",
+    "File Size (MB)",
+    "Size (bytes)",
+    "SHA-256",
+    "Verified",
+    "Retries",
+    "Duration (s)",
+    "Throughput (MB/s)",
+    "Timestamp",
+]
+
 # Series mapping (matches Monday.com group titles)
 SERIES_MAP = {
     "high_school_core": "Core High School",
@@ -44,95 +244,1446 @@ SERIES_MAP = {
 }
 
 
+def create_session(pool_size: int = 1) -> requests.Session:
+    """Create a requests session with a connection pool sized for pool_size threads.
+
+    Sessions are shared by all worker threads, so each per-host pool keeps
+    one connection per thread. A smaller pool would open and throw away
+    extra connections, redoing the TCP and TLS handshake each time.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=max(1, pool_size))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def parse_rate(value: str) -> Optional[float]:
+    """Parse a rate such as ``20MB/s``, ``512K`` or ``1.5M`` into bytes per second.
+
+    ``0``, ``off`` and ``none`` mean no limit and return None.
+    """
+    text = value.strip().upper().replace(" ", "")
+    if text in ("", "0", "OFF", "NONE", "UNLIMITED"):
+        return None
+
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)([KMG]?)(?:I?B)?(?:/S)?", text)
+    if not match:
+        raise ValueError(f"Invalid rate '{value}', expected e.g. 20MB/s, 512KB/s or 0 for no limit")
+
+    rate = float(match.group(1)) * RATE_UNITS[match.group(2)]
+    return rate or None
+
+
+def preallocate(fd: int, offset: int, length: int) -> None:
+    """Reserve disk space for the rest of a download, where supported.
+
+    Keeps the file's size unchanged (FALLOC_FL_KEEP_SIZE), because the
+    size of a ``.part`` file is how far the download has got.
+    posix_fallocate() would grow the file and break resuming.
+
+    Raises OSError when the disk is full, so the download fails before
+    transferring anything. Other failures, such as a file system without
+    fallocate, are ignored; the space is then allocated as the file is
+    written.
+    """
+    if _fallocate is None or length <= 0:
+        return
+    if _fallocate(fd, FALLOC_FL_KEEP_SIZE, offset, length) == 0:
+        return
+    error = ctypes.get_errno()
+    if error in PREALLOCATE_FATAL_ERRNOS:
+        raise OSError(error, os.strerror(error))
+
+
+def session_connection_stats(session: requests.Session) -> Dict[str, Dict[str, int]]:
+    """Count connections opened and reused, per host, by a requests session."""
+    stats = {}
+    adapters = {id(adapter): adapter for adapter in session.adapters.values()}
+
+    for adapter in adapters.values():
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools[key]
+            host_stats = stats.setdefault(pool.host, {"opened": 0, "reused": 0})
+            host_stats["opened"] += pool.num_connections
+            host_stats["reused"] += max(0, pool.num_requests - pool.num_connections)
+
+    return stats
+
+
+class MondayAPIError(Exception):
+    """A Monday.com API request failed or returned GraphQL errors."""
+
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        retry_after: Optional[float] = None,
+    ):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class IncompleteDownload(Exception):
+    """The server closed a download before sending every byte."""
+
+
+class FileChanged(IncompleteDownload):
+    """A file changed on the server part-way through a segmented download."""
+
+
+class DownloadCancelled(Exception):
+    """A transfer was abandoned because the run is stopping."""
+
+
+class ChecksumMismatch(Exception):
+    """A download's bytes don't match the checksum the file host sent."""
+
+
+class UnexpectedContent(Exception):
+    """A download isn't the kind of file its column holds, such as an error page."""
+
+    def __init__(self, message: str, markup: bool = False):
+        super().__init__(message)
+        self.markup = markup  # Looks like an HTML or XML page
+
+
+class ComplexityBudgetExhausted(MondayAPIError):
+    """Monday.com rejected a query because the complexity budget ran out."""
+
+    def __init__(self, message: str, retry_in: float):
+        super().__init__(message, 429)
+        self.retry_in = retry_in
+
+
+class ComplexityBudget:
+    """Client-side view of Monday.com's per-minute complexity budget.
+
+    Each response reports the query's cost, the budget left and when it
+    resets. Before a query is sent, ``reserve`` sets aside what that query
+    cost last time; if the budget cannot cover it, the caller is told how
+    long to wait for the reset instead of sending a query Monday.com would
+    reject. All threads and coroutines using the API share one budget,
+    since they draw on the same account limit.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.remaining = None  # Unknown until the first response
+        self.limit = 0  # Largest budget seen at the start of a window
+        self.reset_at = 0.0  # time.monotonic() when the window resets
+        self.costs = {}  # Query text -> cost the last time it ran
+        self.used = 0
+        self.waits = 0
+        self.requests = 0  # Queries sent, including retries
+
+    def reserve(self, query: str) -> float:
+        """Reserve budget for a query, returning seconds to wait first."""
+        with self._lock:
+            now = time.monotonic()
+            if self.remaining is not None and now >= self.reset_at:
+                # A new window; its size is unknown if no query has reported it
+                self.remaining = self.limit or None
+                self.reset_at = now + COMPLEXITY_WINDOW
+
+            if self.remaining is None:
+                self.requests += 1
+                return 0.0
+
+            # Queries not seen yet are assumed to cost as much as the dearest
+            cost = self.costs.get(query, max(self.costs.values(), default=0))
+            if 0 < self.remaining and cost <= self.remaining:
+                self.remaining -= cost
+                self.requests += 1
+                return 0.0
+
+            self.waits += 1
+            return self.reset_at - now
+
+    def update(self, query: str, complexity: Optional[Dict]) -> None:
+        """Record the ``complexity`` field returned with a query."""
+        if not complexity:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            before = complexity.get("before") or 0
+            after = complexity.get("after") or 0
+            cost = complexity.get("query") or max(0, before - after)
+            reset_at = now + (complexity.get("reset_in_x_seconds") or COMPLEXITY_WINDOW)
+
+            self.costs[query] = cost
+            self.used += cost
+            self.limit = max(self.limit, before)
+
+            # Responses can arrive out of order; within one window keep the
+            # lower figure, which also accounts for queries still in flight
+            if self.remaining is None or reset_at > self.reset_at + 1:
+                self.remaining = after
+            else:
+                self.remaining = min(self.remaining, after)
+            self.reset_at = reset_at
+
+    def exhausted(self, retry_in: float) -> None:
+        """Mark the budget as spent after Monday.com rejected a query."""
+        with self._lock:
+            self.remaining = 0
+            self.reset_at = max(self.reset_at, time.monotonic() + retry_in)
+            self.waits += 1
+
+
+class BandwidthLimiter:
+    """Token bucket capping the combined rate of every download stream.
+
+    Streams call ``reserve`` for each block they read and sleep for the
+    time it returns, so concurrent downloads share the rate between them.
+    The bucket holds at most BANDWIDTH_BURST seconds of traffic. The rate
+    can be changed while running with ``set_rate``, or by writing a new
+    rate to ``rate_file``, which is re-read whenever it changes.
+    """
+
+    def __init__(self, rate: Optional[float] = None, rate_file: Optional[str] = None):
+        self._lock = threading.Lock()
+        self.rate = rate  # Bytes per second, or None for no limit
+        self.rate_file = Path(rate_file) if rate_file else None
+        self._tokens = (rate or 0) * BANDWIDTH_BURST
+        self._updated = time.monotonic()
+        self._checked = None  # time.monotonic() of the last rate_file check
+        self._file_mtime = None
+        with self._lock:
+            self._check_rate_file(self._updated)
+
+    def set_rate(self, rate: Optional[float]) -> None:
+        """Change the rate limit; None removes it."""
+        with self._lock:
+            self.rate = rate
+
+    def _check_rate_file(self, now: float) -> None:
+        """Pick up a new rate from rate_file, if it changed. Call with the lock held."""
+        if not self.rate_file:
+            return
+        if self._checked is not None and now - self._checked < RATE_FILE_POLL:
+            return
+        self._checked = now
+
+        try:
+            mtime = self.rate_file.stat().st_mtime
+            if mtime == self._file_mtime:
+                return
+            self._file_mtime = mtime
+            self.rate = parse_rate(self.rate_file.read_text())
+        except (OSError, ValueError):
+            pass  # Keep the current rate until the file is readable again
+
+    def reserve(self, nbytes: int) -> float:
+        """Take ``nbytes`` from the bucket, returning seconds to wait first."""
+        with self._lock:
+            now = time.monotonic()
+            self._check_rate_file(now)
+
+            if not self.rate:
+                self._updated = now
+                return 0.0
+
+            capacity = self.rate * BANDWIDTH_BURST
+            self._tokens = min(capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            # Going into debt lets blocks of any size through, at the right pace
+            self._tokens -= nbytes
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+
+class FileDigest:
+    """Running SHA-256 of a download, checked against the host's checksums.
+
+    Checksums come from the response headers: ``Content-MD5``,
+    ``x-amz-checksum-sha256``, the MD5 in ``x-goog-hash``, or an S3 ETag
+    that is the file's MD5. Headers that describe only the bytes sent are
+    ignored for range responses, which carry part of the file.
+    """
+
+    def __init__(self, headers=None, partial: bool = False):
+        self.sha256 = hashlib.sha256()
+        self.expected = self.expected_checksums(headers or {}, partial)
+        self.md5 = hashlib.md5() if "md5" in self.expected else None
+
+    @staticmethod
+    def expected_checksums(headers, partial: bool = False) -> Dict[str, str]:
+        """Hex digests of the whole file that the response headers promise."""
+        expected = {}
+
+        # S3 ETags are the MD5 of single-part uploads, unless the object is
+        # encrypted with KMS or a customer key; multipart ETags contain "-"
+        etag = headers.get("ETag", "")
+        encryption = headers.get("x-amz-server-side-encryption", "")
+        if (
+            re.fullmatch(r'"[0-9a-fA-F]{32}"', etag)
+            and not encryption.startswith("aws:kms")
+            and "x-amz-server-side-encryption-customer-algorithm" not in headers
+        ):
+            expected["md5"] = etag.strip('"').lower()
+
+        if partial:
+            return expected
+
+        encoded = {
+            algorithm: headers.get(name)
+            for name, algorithm in CHECKSUM_HEADERS.items()
+            if headers.get(name)
+        }
+        match = re.search(r"md5=([A-Za-z0-9+/=]+)", headers.get("x-goog-hash", ""))
+        if match:
+            encoded["md5"] = match.group(1)
+
+        for algorithm, value in encoded.items():
+            try:
+                expected[algorithm] = base64.b64decode(value, validate=True).hex()
+            except (binascii.Error, ValueError):
+                continue
+        return expected
+
+    def update(self, block) -> None:
+        self.sha256.update(block)
+        if self.md5:
+            self.md5.update(block)
+
+    def hexdigest(self) -> str:
+        """The SHA-256 recorded in the manifest and report."""
+        return self.sha256.hexdigest()
+
+    def verify(self) -> List[str]:
+        """Check every promised checksum, returning the algorithms checked."""
+        for algorithm, expected in self.expected.items():
+            actual = (self.sha256 if algorithm == "sha256" else self.md5).hexdigest()
+            if actual != expected:
+                raise ChecksumMismatch(
+                    f"{algorithm.upper()} mismatch: host sent {expected}, got {actual}"
+                )
+        return sorted(self.expected)
+
+
+class ContentSniffer:
+    """Checks that a download starts like the kind of file its column holds.
+
+    Bytes are fed in as they arrive. Once SNIFF_SIZE have been seen they
+    are compared with FILE_SIGNATURES, so an error page served in place of
+    a file is caught before the rest of it is downloaded.
+    """
+
+    def __init__(self, kind: Optional[str] = None):
+        self.kind = kind
+        # Nothing to check for kinds without signatures
+        self.head = b"" if kind in FILE_SIGNATURES else None
+
+    def feed(self, block) -> None:
+        if self.head is None:
+            return
+        self.head += bytes(block[:SNIFF_SIZE - len(self.head)])
+        if len(self.head) >= SNIFF_SIZE:
+            self.check()
+
+    def check(self) -> None:
+        """Check the bytes seen so far, for files shorter than SNIFF_SIZE."""
+        head, self.head = self.head, None
+        if not head or self.matches(self.kind, head):
+            return
+        markup = head.lstrip(b"\xef\xbb\xbf \t\r\n").startswith(b"<")
+        found = "an HTML/XML page" if markup else f"a file starting {head[:8].hex(' ')}"
+        raise UnexpectedContent(f"Expected {self.kind} but got {found}", markup)
+
+    @staticmethod
+    def matches(kind: str, head: bytes) -> bool:
+        """Whether leading bytes fit a kind of file."""
+        if kind == "audio" and len(head) >= 2 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0:
+            return True
+        return any(
+            head[offset:offset + len(magic)] == magic
+            for offset, magic in FILE_SIGNATURES[kind]
+        )
+
+
+class StageTimings:
+    """Durations of every board page, URL batch and download, by stage.
+
+    Shared by all workers (and series), so samples are added under a lock.
+    The summary reports percentiles of each stage from them.
+    """
+
+    def __init__(self):
+        self.samples = {stage: [] for stage in TIMED_STAGES}
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.samples[stage].append(seconds)
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """Time the body of a ``with`` block as one sample of a stage."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - started)
+
+    def sorted_samples(self, stage: str) -> List[float]:
+        """A stage's durations so far, shortest first."""
+        with self._lock:
+            return sorted(self.samples[stage])
+
+    def percentiles(self, stage: str) -> Optional[List[float]]:
+        """TIMING_PERCENTILES of a stage's durations, or None without samples."""
+        samples = self.sorted_samples(stage)
+        if not samples:
+            return None
+        # Nearest-rank: the smallest sample with at least p% at or below it
+        return [
+            samples[max(0, -(-len(samples) * percent // 100) - 1)]
+            for percent in TIMING_PERCENTILES
+        ]
+
+
+class TransferClock:
+    """Times the stages of one download attempt.
+
+    Time to first byte runs from sending the request to getting the
+    response headers; transfer from then until the file is in place. Disk
+    writes are the part of the transfer spent hashing and writing blocks,
+    added up across the threads of a segmented download.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.first_byte = None
+        self.disk_write = 0.0
+        self._lock = threading.Lock()
+
+    def response_started(self) -> None:
+        self.first_byte = time.perf_counter()
+
+    def add_disk_write(self, seconds: float) -> None:
+        with self._lock:
+            self.disk_write += seconds
+
+    def stages(self) -> Dict[str, float]:
+        """Seconds spent in each stage so far, by TIMED_STAGES key."""
+        first_byte = self.first_byte or self.started
+        return {
+            "ttfb": first_byte - self.started,
+            "transfer": time.perf_counter() - first_byte,
+            "disk_write": self.disk_write,
+        }
+
+
+class RetryPolicy:
+    """Shared rules for retrying failed API calls and downloads.
+
+    Timeouts, dropped connections, rate limits and server errors are
+    retried with capped exponential backoff and full jitter, so workers
+    that failed together don't retry together. A ``Retry-After`` header is
+    honored when the server sends one. Anything else, including 401 and
+    403, fails straight away.
+    """
+
+    def __init__(
+        self,
+        attempts: int = RETRY_ATTEMPTS,
+        base_delay: float = RETRY_BASE_DELAY,
+        max_delay: float = RETRY_MAX_DELAY,
+    ):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self.retries = {"api": 0, "download": 0}
+
+    @staticmethod
+    def retry_after(headers) -> Optional[float]:
+        """Seconds to wait from a ``Retry-After`` header, if there is one."""
+        value = (headers or {}).get("Retry-After")
+        if not value:
+            return None
+        if value.strip().isdigit():
+            return float(value)
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+    @staticmethod
+    def _status(error: Exception) -> Tuple[Optional[int], Optional[float]]:
+        """The HTTP status and Retry-After delay behind an error, if any."""
+        if isinstance(error, MondayAPIError):
+            return error.status_code, error.retry_after
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            return error.response.status_code, RetryPolicy.retry_after(error.response.headers)
+        if aiohttp and isinstance(error, aiohttp.ClientResponseError):
+            return error.status, RetryPolicy.retry_after(error.headers)
+        return None, None
+
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        """Whether an error is transient, so the same request may succeed later."""
+        if isinstance(error, ComplexityBudgetExhausted):
+            return False  # Waited out by the ComplexityBudget instead
+
+        status, _ = RetryPolicy._status(error)
+        if status is not None:
+            return status in RETRYABLE_STATUS_CODES
+
+        transient = (
+            IncompleteDownload,
+            ChecksumMismatch,
+            ConnectionError,
+            TimeoutError,
+            requests.ConnectionError,
+            requests.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+            # Raised by direct reads from the raw response stream
+            urllib3.exceptions.ProtocolError,
+            urllib3.exceptions.TimeoutError,
+        )
+        if aiohttp:
+            transient += (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)
+        return isinstance(error, transient)
+
+    def backoff(self, error: Exception, attempt: int, kind: str = "api") -> Optional[float]:
+        """Seconds to wait before retry number ``attempt + 1``, or None to give up.
+
+        ``kind`` ("api" or "download") picks the retry counter to update.
+        """
+        if attempt >= self.attempts or not self.is_retryable(error):
+            return None
+
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        _, retry_after = self._status(error)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        with self._lock:
+            self.retries[kind] += 1
+        return delay
+
+
 class MondayAPIClient:
     """Client for interacting with Monday.com GraphQL API."""
 
-    def __init__(self, api_token: str):
+    # Requested with every query to keep the shared ComplexityBudget current
+    COMPLEXITY_FIELDS = """
+      complexity {
+        before
+        query
+        after
+        reset_in_x_seconds
+      }
+    """
+
+    # Fields requested for every page of items. Column values are limited
+    # to $columnIds when it is set, or include every column when it is null.
+    ITEMS_PAGE_FIELDS = """
+          cursor
+          items {
+            id
+            name
+            updated_at
+            group {
+              id
+              title
+            }
+            column_values(ids: $columnIds) {
+              id
+              value
+              text
+              type
+            }
+          }
+    """
+
+    BOARD_ITEMS_QUERY = """
+    query ($boardId: [ID!], $limit: Int!, $columnIds: [String!], $queryParams: ItemsQuery) {""" + COMPLEXITY_FIELDS + """
+      boards(ids: $boardId) {
+        items_page(limit: $limit, query_params: $queryParams) {""" + ITEMS_PAGE_FIELDS + """}
+      }
+    }
+    """
+
+    GROUP_ITEMS_QUERY = """
+    query (
+      $boardId: [ID!], $groupId: [String], $limit: Int!, $columnIds: [String!],
+      $queryParams: ItemsQuery
+    ) {""" + COMPLEXITY_FIELDS + """
+      boards(ids: $boardId) {
+        groups(ids: $groupId) {
+          items_page(limit: $limit, query_params: $queryParams) {""" + ITEMS_PAGE_FIELDS + """}
+        }
+      }
+    }
+    """
+
+    NEXT_ITEMS_QUERY = """
+    query ($limit: Int!, $cursor: String!, $columnIds: [String!]) {""" + COMPLEXITY_FIELDS + """
+      next_items_page(limit: $limit, cursor: $cursor) {""" + ITEMS_PAGE_FIELDS + """}
+    }
+    """
+
+    GROUPS_QUERY = """
+    query ($boardId: [ID!]) {""" + COMPLEXITY_FIELDS + """
+      boards(ids: $boardId) {
+        groups {
+          id
+          title
+        }
+      }
+    }
+    """
+
+    ASSETS_QUERY = """
+    query ($assetIds: [ID!]!) {""" + COMPLEXITY_FIELDS + """
+      assets(ids: $assetIds) {
+        id
+        name
+        public_url
+      }
+    }
+    """
+
+    def __init__(
+        self,
+        api_token: str,
+        pool_size: int = 1,
+        budget: Optional[ComplexityBudget] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
         self.api_token = api_token
         self.headers = {
             "Authorization": api_token,
             "Content-Type": "application/json",
         }
-
-    def query(self, query: str, variables: Optional[Dict] = None) -> Dict:
-        """Execute a GraphQL query against Monday.com API."""
+        # Long-lived session so API calls reuse connections to api.monday.com
+        self.session = create_session(pool_size)
+        self.session.headers.update(self.headers)
+        self.budget = budget or ComplexityBudget()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._group_cache = {}  # Board ID -> {group title: group ID}
+
+    @staticmethod
+    def _build_payload(query: str, variables: Optional[Dict] = None) -> Dict:
+        """Build the JSON body for a GraphQL request."""
         data = {"query": query}
         if variables:
             data["variables"] = variables
+        return data
+
+    @staticmethod
+    def _complexity_retry_in(result: Dict) -> Optional[float]:
+        """Seconds until the budget resets, if a query was rejected for complexity."""
+        errors = list(result.get("errors") or [])
+        if result.get("error_code"):
+            errors.append({
+                "message": result.get("error_message", ""),
+                "extensions": {"code": result["error_code"]},
+            })
+
+        for error in errors:
+            extensions = error.get("extensions") or {}
+            if extensions.get("code") not in COMPLEXITY_ERROR_CODES:
+                continue
+            if extensions.get("retry_in_seconds") is not None:
+                return float(extensions["retry_in_seconds"])
+            match = re.search(r"reset in (\d+) seconds", error.get("message", ""))
+            return float(match.group(1)) if match else float(COMPLEXITY_WINDOW)
 
-        response = requests.post(API_URL, headers=self.headers, json=data)
+        return None
 
-        if response.status_code != 200:
-            raise Exception(
-                f"Error fetching data: {response.status_code}\n{response.text}"
-            )
+    @staticmethod
+    def _parse_response(status_code: int, text: str, headers=None) -> Dict:
+        """Check a GraphQL HTTP response and return its data.
 
-        result = response.json()
+        Raises ComplexityBudgetExhausted when Monday.com rejected the query
+        for complexity, and MondayAPIError for any other failure.
+        """
+        try:
+            result = json.loads(text)
+        except ValueError:
+            result = None
+
+        if isinstance(result, dict):
+            retry_in = MondayAPIClient._complexity_retry_in(result)
+            if retry_in is not None:
+                raise ComplexityBudgetExhausted(
+                    f"Complexity budget exhausted: {text}", retry_in
+                )
+
+        if status_code != 200 or not isinstance(result, dict):
+            raise MondayAPIError(
+                f"Error fetching data: {status_code}\n{text}",
+                status_code,
+                RetryPolicy.retry_after(headers),
+            )
 
         if "errors" in result:
-            raise Exception(f"GraphQL errors: {result['errors']}")
+            raise MondayAPIError(f"GraphQL errors: {result['errors']}", status_code)
 
         return result.get("data", {})
 
+    def query(self, query: str, variables: Optional[Dict] = None) -> Dict:
+        """Execute a GraphQL query against Monday.com API.
+
+        Waits for the complexity budget when it cannot cover the query, and
+        retries queries Monday.com rejects for complexity once it resets.
+        Transient failures are retried as the retry policy allows.
+        """
+        data = self._build_payload(query, variables)
+        retries = {"complexity": 0, "attempt": 0}
+
+        while True:
+            delay = self.budget.reserve(query)
+            while delay > 0:
+                time.sleep(delay)
+                delay = self.budget.reserve(query)
+
+            try:
+                response = self.session.post(API_URL, json=data, timeout=API_TIMEOUT)
+                result = self._parse_response(
+                    response.status_code, response.text, response.headers
+                )
+            except Exception as e:
+                time.sleep(self._retry_delay(e, self.budget, self.retry_policy, retries))
+                continue
+
+            self.budget.update(query, result.pop("complexity", None))
+            return result
+
+    @staticmethod
+    def _retry_delay(
+        error: Exception,
+        budget: ComplexityBudget,
+        retry_policy: RetryPolicy,
+        retries: Dict[str, int],
+    ) -> float:
+        """How long to wait before retrying a failed query, or re-raise its error.
+
+        Queries rejected for complexity are retried, up to COMPLEXITY_RETRIES
+        times, once the budget resets. ``retries`` counts both kinds of retry
+        across a query's attempts.
+        """
+        if isinstance(error, ComplexityBudgetExhausted):
+            if retries["complexity"] == COMPLEXITY_RETRIES:
+                raise error
+            retries["complexity"] += 1
+            budget.exhausted(error.retry_in)
+            return 0.0
+
+        delay = retry_policy.backoff(error, retries["attempt"])
+        if delay is None:
+            raise error
+        retries["attempt"] += 1
+        return delay
+
+    @staticmethod
+    def _board_items_request(
+        board_id: str,
+        limit: int,
+        cursor: Optional[str],
+        group_id: Optional[str],
+        column_ids: Optional[List[str]] = None,
+        query_params: Optional[Dict] = None,
+    ) -> Tuple[str, Dict]:
+        """Build the query and variables for one page of board items.
+
+        The first page comes from the board, or from a single group when
+        ``group_id`` is given. Later pages are fetched from the cursor alone,
+        which carries any ``query_params`` filter forward.
+        """
+        if cursor:
+            query = MondayAPIClient.NEXT_ITEMS_QUERY
+            variables = {"limit": limit, "cursor": cursor}
+        elif group_id:
+            query = MondayAPIClient.GROUP_ITEMS_QUERY
+            variables = {"boardId": board_id, "groupId": [group_id], "limit": limit}
+        else:
+            query = MondayAPIClient.BOARD_ITEMS_QUERY
+            variables = {"boardId": board_id, "limit": limit}
+
+        if column_ids is not None:
+            variables["columnIds"] = list(column_ids)
+        if query_params and not cursor:
+            variables["queryParams"] = query_params
+
+        return query, variables
+
+    @staticmethod
+    def _parse_board_items(data: Dict) -> Tuple[List[Dict], Optional[str]]:
+        """Extract the items and next cursor from a board items response."""
+        if "next_items_page" in data:
+            items_page = data.get("next_items_page") or {}
+        else:
+            board = (data.get("boards") or [{}])[0]
+            if "groups" in board:
+                board = (board.get("groups") or [{}])[0]
+            items_page = board.get("items_page") or {}
+        return items_page.get("items", []), items_page.get("cursor")
+
     def fetch_board_items(
-        self, board_id: str, limit: int = 100, cursor: Optional[str] = None
+        self,
+        board_id: str,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        group_id: Optional[str] = None,
+        column_ids: Optional[List[str]] = None,
+        query_params: Optional[Dict] = None,
     ) -> Tuple[List[Dict], Optional[str]]:
-        """Fetch items from a Monday.com board with cursor-based pagination."""
-        query = """
-        query ($boardId: [ID!], $limit: Int!, $cursor: String) {
-          boards(ids: $boardId) {
-            items_page(limit: $limit, cursor: $cursor) {
-              cursor
-              items {
-                id
-                name
-                group {
-                  id
-                  title
-                }
-                column_values {
-                  id
-                  value
-                  text
-                  type
-                }
-              }
-            }
-          }
+        """Fetch items from a Monday.com board with cursor-based pagination.
+
+        Pass ``group_id`` to page through a single group instead of the
+        whole board, and ``column_ids`` to return only those columns'
+        values (none at all for an empty list). Fewer columns keep each
+        page's complexity cost down, which leaves room for larger pages.
+        ``query_params`` is passed through as the items_page filter
+        (Monday.com's ItemsQuery).
+        """
+        query, variables = self._board_items_request(
+            board_id, limit, cursor, group_id, column_ids, query_params
+        )
+        data = self.query(query, variables)
+        return self._parse_board_items(data)
+
+    @staticmethod
+    def _parse_groups(data: Dict) -> Dict[str, str]:
+        """Map group title to group ID from a groups response."""
+        board = (data.get("boards") or [{}])[0]
+        return {
+            group.get("title"): group.get("id")
+            for group in board.get("groups") or []
         }
+
+    def fetch_group_ids(self, board_id: str) -> Dict[str, str]:
+        """Map each group title on a board to its ID, cached per board."""
+        if board_id not in self._group_cache:
+            data = self.query(self.GROUPS_QUERY, {"boardId": board_id})
+            self._group_cache[board_id] = self._parse_groups(data)
+        return self._group_cache[board_id]
+
+    @staticmethod
+    def _asset_batches(asset_ids: List) -> List[List[str]]:
+        """Split asset IDs into de-duplicated batches for the assets query."""
+        # De-duplicate while keeping order so batches are deterministic
+        unique_ids = list(dict.fromkeys(str(asset_id) for asset_id in asset_ids))
+        return [
+            unique_ids[start:start + ASSET_BATCH_SIZE]
+            for start in range(0, len(unique_ids), ASSET_BATCH_SIZE)
+        ]
+
+    @staticmethod
+    def _parse_asset_urls(data: Dict) -> Dict[str, str]:
+        """Map asset ID to public URL for every asset in a response."""
+        return {
+            str(asset.get("id")): asset["public_url"]
+            for asset in data.get("assets") or []
+            if asset.get("public_url")
+        }
+
+    @staticmethod
+    def _is_fatal(error: Exception) -> bool:
+        """Whether an API error should stop the run rather than skip a batch."""
+        if isinstance(error, ComplexityBudgetExhausted):
+            return True
+        return isinstance(error, MondayAPIError) and error.status_code in FATAL_STATUS_CODES
+
+    @staticmethod
+    def _batch_failed(batch: List[str], error: Exception, errors: Optional[Dict[str, str]]) -> None:
+        """Map a failed batch's IDs to its error, or re-raise errors that should stop the run."""
+        if MondayAPIClient._is_fatal(error):
+            raise error
+        if errors is not None:
+            errors.update(dict.fromkeys(batch, str(error)))
+
+    def fetch_asset_urls(
+        self, asset_ids: List, errors: Optional[Dict[str, str]] = None
+    ) -> Dict[str, str]:
+        """Fetch download URLs for many assets, batching IDs per query.
+
+        Returns a mapping of asset ID (as a string) to public URL. Assets
+        that could not be resolved are left out of the mapping; when a batch
+        fails, each of its IDs is mapped to the error in ``errors``. Errors
+        no later batch could get past, such as a rejected token, are raised.
         """
+        urls = {}
 
-        variables = {"boardId": board_id, "limit": limit}
-        if cursor:
-            variables["cursor"] = cursor
+        for batch in self._asset_batches(asset_ids):
+            try:
+                data = self.query(self.ASSETS_QUERY, {"assetIds": batch})
+            except Exception as e:
+                self._batch_failed(batch, e, errors)
+                continue
 
-        data = self.query(query, variables)
-        items_page = data.get("boards", [{}])[0].get("items_page", {})
-        return items_page.get("items", []), items_page.get("cursor")
+            urls.update(self._parse_asset_urls(data))
+
+        return urls
 
     def fetch_asset_url(self, asset_id: int) -> Optional[str]:
         """Fetch the download URL for an asset by its ID."""
-        query = """
-        query ($assetIds: [ID!]!) {
-          assets(ids: $assetIds) {
-            id
-            name
-            public_url
-          }
+        return self.fetch_asset_urls([asset_id]).get(str(asset_id))
+
+
+class AsyncMondayAPIClient:
+    """Coroutine counterpart of MondayAPIClient for the async engine.
+
+    Requests go through a shared ``aiohttp.ClientSession`` so connections are
+    pooled with the asset downloads. Queries and response handling are the
+    same as MondayAPIClient's.
+    """
+
+    def __init__(
+        self,
+        api_token: str,
+        session: "aiohttp.ClientSession",
+        budget: Optional[ComplexityBudget] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
+        self.api_token = api_token
+        self.session = session
+        self.budget = budget or ComplexityBudget()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.headers = {
+            "Authorization": api_token,
+            "Content-Type": "application/json",
+        }
+        self._group_cache = {}  # Board ID -> {group title: group ID}
+
+    async def query(self, query: str, variables: Optional[Dict] = None) -> Dict:
+        """Execute a GraphQL query against Monday.com API, within the budget."""
+        data = MondayAPIClient._build_payload(query, variables)
+        timeout = aiohttp.ClientTimeout(total=API_TIMEOUT)
+        retries = {"complexity": 0, "attempt": 0}
+
+        while True:
+            delay = self.budget.reserve(query)
+            while delay > 0:
+                await asyncio.sleep(delay)
+                delay = self.budget.reserve(query)
+
+            try:
+                async with self.session.post(
+                    API_URL, headers=self.headers, json=data, timeout=timeout
+                ) as response:
+                    text = await response.text()
+                    status, headers = response.status, response.headers
+                result = MondayAPIClient._parse_response(status, text, headers)
+            except Exception as e:
+                await asyncio.sleep(
+                    MondayAPIClient._retry_delay(e, self.budget, self.retry_policy, retries)
+                )
+                continue
+
+            self.budget.update(query, result.pop("complexity", None))
+            return result
+
+    async def fetch_board_items(
+        self,
+        board_id: str,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        group_id: Optional[str] = None,
+        column_ids: Optional[List[str]] = None,
+        query_params: Optional[Dict] = None,
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """Fetch items from a Monday.com board with cursor-based pagination."""
+        query, variables = MondayAPIClient._board_items_request(
+            board_id, limit, cursor, group_id, column_ids, query_params
+        )
+        data = await self.query(query, variables)
+        return MondayAPIClient._parse_board_items(data)
+
+    async def fetch_group_ids(self, board_id: str) -> Dict[str, str]:
+        """Map each group title on a board to its ID, cached per board."""
+        if board_id not in self._group_cache:
+            data = await self.query(MondayAPIClient.GROUPS_QUERY, {"boardId": board_id})
+            self._group_cache[board_id] = MondayAPIClient._parse_groups(data)
+        return self._group_cache[board_id]
+
+    async def fetch_asset_urls(
+        self, asset_ids: List, errors: Optional[Dict[str, str]] = None
+    ) -> Dict[str, str]:
+        """Fetch download URLs for many assets, running batches concurrently."""
+
+        async def fetch_batch(batch: List[str]) -> Dict[str, str]:
+            try:
+                data = await self.query(MondayAPIClient.ASSETS_QUERY, {"assetIds": batch})
+            except Exception as e:
+                MondayAPIClient._batch_failed(batch, e, errors)
+                return {}
+            return MondayAPIClient._parse_asset_urls(data)
+
+        urls = {}
+        batches = MondayAPIClient._asset_batches(asset_ids)
+        for batch_urls in await asyncio.gather(*(fetch_batch(b) for b in batches)):
+            urls.update(batch_urls)
+        return urls
+
+
+class AssetManifest:
+    """Local record of every asset downloaded, keyed by Monday.com asset ID.
+
+    Lets later runs tell an unchanged file from a truncated or replaced one
+    without asking Monday.com. Entries are held in memory for fast lookups
+    during planning and written through to a SQLite file. The manifest is
+    safe to share between worker threads.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS assets (
+                asset_id TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                sha256 TEXT,
+                source_host TEXT,
+                downloaded_at TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+        self._by_asset = {}
+        self._by_path = {}
+        columns = ("asset_id", "path", "size", "sha256", "source_host", "downloaded_at")
+        for row in self._conn.execute(f"SELECT {', '.join(columns)} FROM assets"):
+            entry = dict(zip(columns, row))
+            self._by_asset[entry["asset_id"]] = entry
+            self._by_path[entry["path"]] = entry
+
+    def get(self, asset_id) -> Optional[Dict]:
+        """Look up the entry for an asset."""
+        with self._lock:
+            return self._by_asset.get(str(asset_id))
+
+    def get_by_path(self, path: str) -> Optional[Dict]:
+        """Look up the entry for whichever asset was last saved to a path."""
+        with self._lock:
+            return self._by_path.get(path)
+
+    def record(
+        self,
+        asset_id,
+        path: str,
+        size: int,
+        sha256: Optional[str] = None,
+        source_host: Optional[str] = None,
+    ) -> None:
+        """Add or replace the entry for an asset."""
+        entry = {
+            "asset_id": str(asset_id),
+            "path": path,
+            "size": size,
+            "sha256": sha256,
+            "source_host": source_host,
+            "downloaded_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         }
-        """
 
-        variables = {"assetIds": [asset_id]}
+        with self._lock:
+            previous = self._by_asset.get(entry["asset_id"])
+            if previous and self._by_path.get(previous["path"]) is previous:
+                del self._by_path[previous["path"]]
+            self._by_asset[entry["asset_id"]] = entry
+            self._by_path[path] = entry
 
+            self._conn.execute(
+                "INSERT OR REPLACE INTO assets VALUES (?, ?, ?, ?, ?, ?)",
+                tuple(entry.values()),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database."""
+        with self._lock:
+            self._conn.close()
+
+
+class ReportWriter:
+    """CSV report of download attempts, written a row at a time.
+
+    Each row is flushed as soon as its file finishes, so a run that crashes
+    still leaves a report of everything it got through, and memory doesn't
+    grow with the size of the run. The file is created with the first row.
+    One writer can be shared by several downloaders and worker threads.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.rows = 0
+        self.error = None  # First error writing the file, after which rows are dropped
+        self._file = None
+        self._writer = None
+        self._lock = threading.Lock()
+
+    def write(self, row: Dict) -> None:
+        """Append a row and flush it to disk."""
+        with self._lock:
+            if self.error:
+                return
+            try:
+                if self._file is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self._file = open(
+                        self.path, "a" if self.rows else "w", newline="", encoding="utf-8"
+                    )
+                    self._writer = csv.DictWriter(self._file, fieldnames=REPORT_FIELDS)
+                    if not self.rows:
+                        self._writer.writeheader()
+                self._writer.writerow(row)
+                self._file.flush()
+                self.rows += 1
+            except OSError as e:
+                self.error = e
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class MetricsExporter:
+    """Publishes a run's progress as Prometheus / OpenMetrics metrics.
+
+    Metrics can be written to a file for node_exporter's textfile
+    collector, rewritten every METRICS_INTERVAL seconds and at the end of
+    the run. They can also be served at ``/metrics`` on a local port while
+    the run lasts.
+    """
+
+    def __init__(self, path: Optional[str] = None, port: Optional[int] = None):
+        self.downloader = None  # The run being published, once started
+        self.path = Path(path) if path else None
+        self.port = port
+        self.started = time.time()
+        self.error = None  # First error writing the file, reported once
+        self._stop = threading.Event()
+        self._threads = []
+        self._server = None
+
+    def start(self, downloader: "PracticeDownloader") -> None:
+        """Start publishing a downloader's run."""
+        self.downloader = downloader
+        if self.port is not None:
+            self._server = ThreadingHTTPServer(("127.0.0.1", self.port), self._handler())
+            self._server.daemon_threads = True
+            self._threads.append(threading.Thread(target=self._server.serve_forever, daemon=True))
+        if self.path:
+            self._threads.append(threading.Thread(target=self._write_periodically, daemon=True))
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and write the final figures."""
+        self._stop.set()
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+        for thread in self._threads:
+            thread.join()
+        if self.path:
+            self.write()
+
+    def _write_periodically(self) -> None:
+        while not self._stop.wait(METRICS_INTERVAL):
+            self.write()
+
+    def write(self) -> None:
+        """Replace the metrics file in one step, so collectors never read half of it."""
+        temp_path = self.path.with_name(self.path.name + ".tmp")
         try:
-            data = self.query(query, variables)
-            assets = data.get("assets", [])
-            if assets:
-                return assets[0].get("public_url")
-        except Exception:
-            pass
+            temp_path.write_text(self.render(openmetrics=False), encoding="utf-8")
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            if not self.error:
+                self.error = e
+                self.downloader._log(f"✗ Could not write metrics to {self.path}: {e}")
+
+    def _handler(self):
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+                body = exporter.render(openmetrics).encode("utf-8")
+                self.send_response(200)
+                self.send_header(
+                    "Content-Type",
+                    OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE,
+                )
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Keep scrapes out of the console
+
+        return Handler
+
+    @staticmethod
+    def _labels(labels: Dict) -> str:
+        """Format a sample's labels, escaped as both formats require."""
+        if not labels:
+            return ""
+        pairs = []
+        for name, value in labels.items():
+            value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+            pairs.append(f'{name}="{value}"')
+        return "{" + ",".join(pairs) + "}"
+
+    def render(self, openmetrics: bool = True) -> str:
+        """The current metrics, in OpenMetrics or the older Prometheus text format."""
+        downloader = self.downloader
+        budget = downloader.client.budget
+        lines = []
+
+        def family(name: str, kind: str, help_text: str, samples: List[Tuple[str, Dict, float]]) -> None:
+            metric = f"{METRICS_PREFIX}_{name}"
+            # OpenMetrics names a counter family without its _total suffix
+            typed = metric + "_total" if kind == "counter" and not openmetrics else metric
+            lines.append(f"# HELP {typed} {help_text}")
+            lines.append(f"# TYPE {typed} {kind}")
+            for suffix, labels, value in samples:
+                lines.append(f"{metric}{suffix}{self._labels(labels)} {value}")
+
+        series_stats = downloader.series_stats()
+        family("files", "counter", "Files finished, by series and status.", [
+            ("_total", {"series": series, "status": status}, stats[status])
+            for series, stats in series_stats.items()
+            for status in ("downloaded", "skipped", "failed")
+        ])
+        family("bytes_received", "counter", "Bytes downloaded, by series.", [
+            ("_total", {"series": series}, stats["bytes_received"])
+            for series, stats in series_stats.items()
+        ])
+        family("api_requests", "counter", "Monday.com API requests sent, including retries.", [
+            ("_total", {}, budget.requests),
+        ])
+        family("api_complexity", "counter", "Monday.com complexity budget consumed.", [
+            ("_total", {}, budget.used),
+        ])
+        family("api_budget_waits", "counter", "Waits for the complexity budget to reset.", [
+            ("_total", {}, budget.waits),
+        ])
+        family("retries", "counter", "Retries after transient failures, by kind.", [
+            ("_total", {"kind": kind}, count)
+            for kind, count in downloader.retry_policy.retries.items()
+        ])
+
+        histogram = []
+        for stage in TIMED_STAGES:
+            samples = downloader.timings.sorted_samples(stage)
+            for bound in METRICS_BUCKETS:
+                histogram.append(
+                    ("_bucket", {"stage": stage, "le": bound}, bisect.bisect_right(samples, bound))
+                )
+            histogram.append(("_bucket", {"stage": stage, "le": "+Inf"}, len(samples)))
+            histogram.append(("_count", {"stage": stage}, len(samples)))
+            histogram.append(("_sum", {"stage": stage}, sum(samples)))
+        family("stage_duration_seconds", "histogram", "Duration of each stage of the run.", histogram)
+
+        family("run_start_time_seconds", "gauge", "Unix time the run started.", [
+            ("", {}, self.started),
+        ])
+        family("run_duration_seconds", "gauge", "Seconds the run has taken so far.", [
+            ("", {}, round(time.time() - self.started, 3)),
+        ])
+
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+class RunProfiler:
+    """Profiles a run for --profile, writing the results to the output directory.
+
+    ``cpu`` runs cProfile over every thread of the run (worker threads and
+    those of asyncio.to_thread each get their own profiler, merged at the
+    end) and saves the stats for pstats or snakeviz. With ``stacks``,
+    every thread's stack is also sampled PROFILE_SAMPLE_INTERVAL apart and
+    saved as collapsed stacks for flame graphs. These are wall-clock
+    samples, so they include time spent waiting.
+
+    ``mem`` traces allocations with tracemalloc and records the peak seen
+    while each of PROFILE_PHASES was under way. Phases overlap when board
+    pages, URL batches and downloads run at the same time.
+
+    Shared by all series like StageTimings. Without a mode it does nothing.
+    """
+
+    def __init__(self, mode: Optional[str] = None, stacks: bool = False, directory: Path = Path(".")):
+        self.mode = mode
+        self.stacks = stacks and mode == "cpu"
+        self.directory = directory
+        self.memory_peaks = {}  # Peak traced bytes while each phase ran
+        self.memory_peak = 0  # Peak traced bytes over the whole run
+        self._prefix = None
+        self._profile = None
+        self._thread_profiles = []
+        self._samples = {}  # Collapsed stack to the times it was sampled
+        self._active = {phase: 0 for phase in PROFILE_PHASES}  # Phases under way, counted per thread or task
+        self._touched = set()  # Phases under way at some point since the last memory sample
+        self._stop = threading.Event()
+        self._sampler = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        if not self.mode:
+            return
+        self._prefix = f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+        if self.mode == "mem":
+            tracemalloc.start()
+            self._sampler = threading.Thread(target=self._sample_memory, daemon=True)
+        elif self.stacks:
+            self._sampler = threading.Thread(target=self._sample_stacks, daemon=True)
+        if self._sampler:
+            self._sampler.start()
+
+        if self.mode == "cpu":
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+            threading.setprofile(self._profile_thread)
+
+    def _profile_thread(self, frame, event, arg) -> None:
+        """Give a newly started thread its own profiler, on its first event."""
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Python 3.12+ profiles every thread from the first profiler
+            sys.setprofile(None)
+            return
+        with self._lock:
+            self._thread_profiles.append(profile)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Count the body of a ``with`` block as part of a phase, for --profile mem."""
+        if self.mode != "mem":
+            yield
+            return
+        with self._lock:
+            self._active[name] += 1
+            self._touched.add(name)
+        try:
+            yield
+        finally:
+            # Attribute the peak so far before the phase stops counting
+            self._note_memory()
+            with self._lock:
+                self._active[name] -= 1
+
+    def _note_memory(self) -> None:
+        """Credit the peak since the last sample to every phase under way meanwhile."""
+        with self._lock:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.reset_peak()
+            self.memory_peak = max(self.memory_peak, peak)
+            for name in self._touched:
+                self.memory_peaks[name] = max(self.memory_peaks.get(name, 0), peak)
+            self._touched = {name for name, count in self._active.items() if count}
+
+    def _sample_memory(self) -> None:
+        while not self._stop.wait(PROFILE_SAMPLE_INTERVAL):
+            self._note_memory()
+
+    def _sample_stacks(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(PROFILE_SAMPLE_INTERVAL):
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                names = []
+                while frame is not None:
+                    code = frame.f_code
+                    names.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                stack = ";".join(reversed(names))
+                self._samples[stack] = self._samples.get(stack, 0) + 1
+
+    def stop(self) -> None:
+        """Stop profiling, save the results and print where they went."""
+        if not self.mode or self._prefix is None:
+            return
+        if self.mode == "cpu":
+            threading.setprofile(None)
+            self._profile.disable()
+        self._stop.set()
+        if self._sampler:
+            self._sampler.join()
 
-        return None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            if self.mode == "cpu":
+                self._save_cpu_profile()
+            else:
+                self._save_memory_profile()
+        except OSError as e:
+            print(f"\n✗ Error saving profile: {e}")
+
+    def _save_cpu_profile(self) -> None:
+        stats = None
+        for profile in [self._profile] + self._thread_profiles:
+            profile.create_stats()
+            if not profile.stats:
+                continue
+            if stats is None:
+                stats = pstats.Stats(profile)
+            else:
+                stats.add(profile)
+        if stats is None:
+            return
+
+        path = self.directory / f"{self._prefix}.pstats"
+        stats.dump_stats(path)
+        print(f"\n✓ CPU profile saved: {path.name} (view with: python3 -m pstats {path})")
+
+        # stats.stats maps (file, line, function) to (calls, primitive calls, own time, cumulative time, callers)
+        top = sorted(stats.stats.items(), key=lambda entry: entry[1][2], reverse=True)
+        print(f"\nTop {PROFILE_TOP_FUNCTIONS} functions by own time (own / cumulative, calls):")
+        for (filename, line, function), (_, calls, own, cumulative, _) in top[:PROFILE_TOP_FUNCTIONS]:
+            # Built-in functions have no source location
+            name = f"{function} ({Path(filename).name}:{line})" if line else function
+            print(f"  {own:>8.3f}s / {cumulative:>8.3f}s  {calls:>8}  {name}")
+
+        if self.stacks and self._samples:
+            path = self.directory / f"{self._prefix}.folded"
+            with open(path, "w", encoding="utf-8") as f:
+                for stack, count in sorted(self._samples.items()):
+                    f.write(f"{stack} {count}\n")
+            print(f"✓ Stack samples saved: {path.name} (collapsed stacks, for flamegraph.pl or speedscope)")
+
+    def _save_memory_profile(self) -> None:
+        self._note_memory()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        path = self.directory / f"{self._prefix}.tracemalloc"
+        snapshot.dump(str(path))
+
+        print("\nPeak traced memory by phase:")
+        for name, label in PROFILE_PHASES.items():
+            if name in self.memory_peaks:
+                print(f"  {label:<20}{self.memory_peaks[name] / (1024 * 1024):>8.1f} MB")
+        print(f"  {'Whole run':<20}{self.memory_peak / (1024 * 1024):>8.1f} MB")
+        print(f"✓ Memory snapshot saved: {path.name} (load with tracemalloc.Snapshot.load)")
 
 
 class PracticeDownloader:
@@ -143,18 +1694,68 @@ class PracticeDownloader:
         api_token: str,
         series: str,
         output_dir: str = "practice_files",
+        workers: int = 1,
+        engine: str = "threads",
+        extra_columns: Optional[List[str]] = None,
+        incremental: bool = False,
+        client: Optional[MondayAPIClient] = None,
+        session: Optional[requests.Session] = None,
+        manifest: Optional[AssetManifest] = None,
+        limiter: Optional[BandwidthLimiter] = None,
+        segments: int = DOWNLOAD_SEGMENTS,
+        report: Optional[ReportWriter] = None,
+        timings: Optional[StageTimings] = None,
+        profiler: Optional[RunProfiler] = None,
+        metrics: Optional[MetricsExporter] = None,
     ):
-        self.client = MondayAPIClient(api_token)
+        self.workers = max(1, workers)
+        self.segments = max(1, segments)  # Byte ranges fetched at once for large files
+        self.client = client or MondayAPIClient(api_token, pool_size=self.workers)
+        # Separate session for asset hosts, shared by all download threads
+        # and by the range requests of segmented downloads
+        self.session = session or create_session(self.workers * self.segments)
+        # API calls and downloads back off under the same rules and counters
+        self.retry_policy = self.client.retry_policy
+        # One bandwidth limit covers every download stream
+        self.limiter = limiter or BandwidthLimiter()
+        # Stage durations for the summary, shared like the limiter
+        self.timings = timings or StageTimings()
+        self.metrics = metrics  # Publishes the run's progress, if asked to
+        self.engine = engine
+        self.incremental = incremental
+        # Only a single-threaded run prints files grouped under practice headers
+        self.sequential = self.workers == 1 and engine == "threads"
         self.series = series
         self.series_name = SERIES_MAP.get(series, series)
-        self.output_dir = Path(output_dir) / self._sanitize_filename(self.series_name)
+        # Only the file columns (plus any extras) are requested from the board
+        self.column_ids = list(dict.fromkeys(list(FILE_COLUMNS) + list(extra_columns or [])))
+        self.root_dir = Path(output_dir)
+        self.output_dir = self.root_dir / self._sanitize_filename(self.series_name)
+        # --profile results, for the whole run across series
+        self.profiler = profiler or RunProfiler()
+        self.manifest = manifest or AssetManifest(self.root_dir / MANIFEST_FILENAME)
+        self.label_prefix = ""  # Prepended to file labels, e.g. the series in multi-series runs
         self.stats = {
             "total_files": 0,
             "downloaded": 0,
             "skipped": 0,
             "failed": 0,
+            "bytes_received": 0,
         }
-        self.download_records = []  # Track all download attempts for CSV report
+        # CSV report, streamed as files finish
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.report = report or ReportWriter(
+            self.output_dir
+            / f"download_report_{self._sanitize_filename(self.series_name)}_{timestamp}.csv"
+        )
+        self._lock = threading.Lock()  # Guards stats and console output
+        self._stopping = threading.Event()  # Set to abandon transfers when a threads run stops
+        self.async_connection_stats = {}  # Per-host connection counts for --engine async
+        self.series_size = 0  # Practices in the series, including unchanged ones
+        self.group_id = None  # Monday.com group of the series, once looked up
+        self._scanned_items = []  # Items seen by a full scan, for the snapshot
+        self._buffers = threading.local()  # Per-thread read buffer for downloads
+        self._pending_snapshot = None  # Board snapshot to save after an incremental run
 
     def _sanitize_filename(self, name: str) -> str:
         """Convert a string to a safe filename."""
@@ -193,6 +1794,26 @@ class PracticeDownloader:
         except (json.JSONDecodeError, KeyError, IndexError, TypeError):
             return None
 
+    def _get_practice_files(self, practice: Dict) -> List[Tuple[str, Dict, Dict]]:
+        """List (column ID, column info, file info) for each file on a practice."""
+        column_values = {
+            col["id"]: col.get("value") for col in practice.get("column_values", [])
+        }
+
+        practice_files = []
+        for col_id, col_info in FILE_COLUMNS.items():
+            if col_id not in column_values:
+                continue
+
+            file_info = self._extract_file_info(column_values[col_id])
+
+            if not file_info or not file_info.get("assetId"):
+                continue
+
+            practice_files.append((col_id, col_info, file_info))
+
+        return practice_files
+
     def _get_file_extension(self, filename: str, url: str) -> str:
         """Determine file extension from filename or URL."""
         if filename and "." in filename:
@@ -203,235 +1824,1767 @@ class PracticeDownloader:
             return Path(url_path).suffix
         return ""
 
-    def _download_file(self, url: str, filepath: Path) -> bool:
-        """Download a file from URL to filepath."""
-        try:
-            response = requests.get(url, stream=True, timeout=30)
-            response.raise_for_status()
-
-            # Create parent directory if it doesn't exist
-            filepath.parent.mkdir(parents=True, exist_ok=True)
+    def _part_path(self, filepath: Path) -> Path:
+        """Path of the in-progress download for a file."""
+        return filepath.with_name(filepath.name + PART_SUFFIX)
 
-            # Download file
-            with open(filepath, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+    def _part_size(self, part_path: Path) -> int:
+        """Bytes already downloaded into a partial file, or 0 if there is none."""
+        try:
+            return part_path.stat().st_size
+        except OSError:
+            return 0
+
+    def _part_info_path(self, part_path: Path) -> Path:
+        """Path of the sidecar recording which asset a partial file holds."""
+        return part_path.with_name(part_path.name + PART_INFO_SUFFIX)
+
+    def _discard_part(self, part_path: Path) -> None:
+        """Delete a partial file and its sidecar."""
+        for path in (part_path, self._part_info_path(part_path)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _open_part(self, part_path: Path, asset_id) -> Tuple[int, Optional[str]]:
+        """Find where to resume a partial file, and the validator to resume it with.
+
+        The filename stays the same when a column is pointed at a new asset,
+        so a partial file is only resumed when its sidecar names the same
+        asset. Otherwise it is discarded. Returns ``(offset, validator)``.
+        """
+        offset = self._part_size(part_path)
+        if not offset:
+            return 0, None
 
-            return True
-        except Exception as e:
-            print(f"    ✗ Error downloading: {e}")
-            return False
+        try:
+            info = json.loads(self._part_info_path(part_path).read_text())
+        except (OSError, ValueError):
+            info = {}
+
+        # Segmented downloads fill the file out of order, so their size
+        # doesn't say how much has arrived
+        if str(info.get("asset_id")) != str(asset_id) or info.get("segmented"):
+            self._discard_part(part_path)
+            return 0, None
+        return offset, info.get("validator")
+
+    def _save_part_info(
+        self, part_path: Path, asset_id, headers, segmented: bool = False
+    ) -> None:
+        """Record the asset and validator of a download starting from byte 0."""
+        self._part_info_path(part_path).write_text(json.dumps({
+            "asset_id": str(asset_id),
+            "validator": self._validator(headers),
+            "segmented": segmented,
+        }))
+
+    def _can_segment(self, headers, total: Optional[int]) -> bool:
+        """Whether a fresh download is big enough, and served so, to fetch in parallel ranges."""
+        return (
+            self.segments > 1
+            and total is not None
+            and total >= SEGMENT_THRESHOLD
+            and headers.get("Accept-Ranges", "").lower() == "bytes"
+        )
 
-    def fetch_practices(self) -> List[Dict]:
-        """Fetch all practices from the board, filtered by series."""
-        print("Fetching practices from Monday.com...")
+    def _split_segments(self, total: int) -> List[Dict]:
+        """Split a file into byte ranges, tracking how far each has got."""
+        size = -(-total // self.segments)
+        return [
+            {"pos": first, "end": min(first + size, total)}
+            for first in range(0, total, size)
+        ]
+
+    @staticmethod
+    def _pwrite_all(fd: int, block, position: int) -> None:
+        """Write a whole block at a position in a file."""
+        view = memoryview(block)
+        while view:
+            written = os.pwrite(fd, view, position)
+            view = view[written:]
+            position += written
+
+    @staticmethod
+    def _check_segment_response(status_code: int, headers, segment: Dict) -> None:
+        """Make sure a range response carries the bytes asked for."""
+        match = re.match(r"bytes (\d+)-", headers.get("Content-Range", ""))
+        if status_code != 206 or not match or int(match.group(1)) != segment["pos"]:
+            # The file changed, so the If-Range check failed; start over
+            raise FileChanged("File changed during a segmented download")
+
+    def _segment_headers(self, segment: Dict, validator: Optional[str]) -> Dict[str, str]:
+        """Request headers for the rest of a segment."""
+        headers = {"Range": f"bytes={segment['pos']}-{segment['end'] - 1}"}
+        if validator:
+            headers["If-Range"] = validator
+        return headers
+
+    @staticmethod
+    def _validator(headers) -> Optional[str]:
+        """The strong ETag, or else Last-Modified, that identifies a response body."""
+        etag = headers.get("ETag")
+        if etag and not etag.startswith("W/"):
+            return etag
+        return headers.get("Last-Modified")
+
+    @staticmethod
+    def _range_headers(offset: int, validator: Optional[str]) -> Dict[str, str]:
+        """Request headers to resume a partial file at ``offset``.
+
+        If-Range makes the server send the whole file instead of a range
+        when the file has changed since the partial download started.
+        """
+        if not offset:
+            return {}
+        headers = {"Range": f"bytes={offset}-"}
+        if validator:
+            headers["If-Range"] = validator
+        return headers
+
+    @staticmethod
+    def _unsatisfiable_size(headers) -> Optional[int]:
+        """The full size from a 416 response's ``Content-Range: bytes */N``."""
+        match = re.match(r"bytes \*/(\d+)", headers.get("Content-Range", ""))
+        return int(match.group(1)) if match else None
+
+    @staticmethod
+    def _resume_point(status_code: int, headers, offset: int) -> Tuple[int, Optional[int]]:
+        """Work out where a response body starts and the file's expected size.
+
+        Returns ``(start, total)``. A 206 whose Content-Range starts at
+        ``offset`` continues the partial file. Any other success response is
+        the whole file, so the download starts again from byte 0. ``total`` is
+        None when the server doesn't say how big the file is.
+        """
+        if offset and status_code == 206:
+            match = re.match(r"bytes (\d+)-\d+/(\d+|\*)", headers.get("Content-Range", ""))
+            if not match or int(match.group(1)) != offset:
+                raise Exception(f"Unexpected Content-Range: {headers.get('Content-Range')}")
+            total = match.group(2)
+            return offset, int(total) if total != "*" else None
+
+        # Content-Length is the encoded size, which can't be checked on disk
+        length = headers.get("Content-Length")
+        if headers.get("Content-Encoding", "identity") != "identity" or not (length or "").isdigit():
+            return 0, None
+        return 0, int(length)
+
+    def _hash_part(
+        self, part_path: Path, start: int, headers=None, partial: bool = False
+    ) -> FileDigest:
+        """Start a digest of a download, fed with any bytes already in a partial file.
+
+        ``headers`` are the response's, for the checksums to verify against.
+        """
+        digest = FileDigest(headers, partial)
+        if start:
+            with open(part_path, "rb") as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(block)
+        return digest
+
+    def _throttle(self, nbytes: int) -> None:
+        """Wait until the bandwidth limit lets ``nbytes`` more through."""
+        delay = self.limiter.reserve(nbytes)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _read_buffer(self) -> memoryview:
+        """This thread's reusable buffer for reading download streams."""
+        buffer = getattr(self._buffers, "buffer", None)
+        if buffer is None:
+            buffer = self._buffers.buffer = memoryview(bytearray(READ_SIZE_MAX))
+        return buffer
+
+    @staticmethod
+    def _write_block(f, digest: FileDigest, block) -> None:
+        """Write a block to a file and add it to the running digest."""
+        digest.update(block)
+        view = memoryview(block)
+        while view:
+            # Unbuffered files can write less than they are given
+            view = view[f.write(view):]
+
+    def _complete_part(
+        self,
+        part_path: Path,
+        filepath: Path,
+        total: Optional[int],
+        digest: Optional[FileDigest] = None,
+    ) -> Dict:
+        """Move a finished partial file into place, if it has every byte.
+
+        The file must match the length the server announced and any
+        checksum it sent. Returns the file's size, SHA-256 and the checks
+        it passed.
+        """
+        size = self._part_size(part_path)
+        if total is not None and size > total:
+            # Can't be resumed into a valid file, so don't keep it around
+            self._discard_part(part_path)
+            raise Exception(f"Downloaded {size} bytes but expected {total}, discarded")
+        if total is not None and size < total:
+            raise IncompleteDownload(f"Incomplete download: got {size} of {total} bytes")
+        if not size:
+            self._discard_part(part_path)
+            raise Exception("Server sent an empty file")
+
+        digest = digest or self._hash_part(part_path, size)
+        try:
+            verified = digest.verify()
+        except ChecksumMismatch:
+            # The bytes on disk are wrong, so a retry has to start over
+            self._discard_part(part_path)
+            raise
+        if total is not None:
+            verified.insert(0, "length")
+
+        os.replace(part_path, filepath)
+        self._discard_part(part_path)
+        return {"size": size, "sha256": digest.hexdigest(), "verified": verified}
+
+    def _check_stopping(self) -> None:
+        """Abandon a transfer once the run is stopping; its .part file is kept."""
+        if self._stopping.is_set():
+            raise DownloadCancelled("Download stopped")
+
+    def _read_segment(
+        self,
+        raw,
+        fd: int,
+        segment: Dict,
+        stop: threading.Event,
+        clock: TransferClock,
+        sniffer: Optional[ContentSniffer] = None,
+    ) -> None:
+        """Copy a response stream into its segment of the file, at its offset."""
+        buffer = self._read_buffer()
+        read_size = READ_SIZE_MIN
+
+        while segment["pos"] < segment["end"]:
+            self._check_stopping()
+            if stop.is_set():
+                raise Exception("Another segment failed")
+            n = raw.readinto(buffer[:min(read_size, segment["end"] - segment["pos"])])
+            if not n:
+                raise IncompleteDownload(
+                    f"Segment ended at byte {segment['pos']} of {segment['end']}"
+                )
+            if sniffer:
+                sniffer.feed(buffer[:n])
+            written = time.perf_counter()
+            self._pwrite_all(fd, buffer[:n], segment["pos"])
+            clock.add_disk_write(time.perf_counter() - written)
+            segment["pos"] += n
+            self._throttle(n)
+            if n == read_size:
+                read_size = min(read_size * 2, READ_SIZE_MAX)
+
+    def _segment_retry_delay(
+        self, error: Exception, attempt: int, stop: Optional[threading.Event] = None
+    ) -> Optional[float]:
+        """The wait before retrying a failed range, or None if it shouldn't be.
+
+        Retrying one range alone can't help once the file changed, or once
+        another range has failed (``stop`` is set).
+        """
+        if isinstance(error, FileChanged) or (stop is not None and stop.is_set()):
+            return None
+        return self.retry_policy.backoff(error, attempt, "download")
 
-        all_items = []
-        cursor = None
-        limit = 100
-        page = 1
+    def _open_segmented(self, part_path: Path, total: int) -> int:
+        """Create the partial file for a segmented download, at its full size."""
+        fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            preallocate(fd, 0, total)
+        except BaseException:
+            os.close(fd)
+            raise
+        return fd
+
+    def _finish_segmented(self, part_path: Path, filepath: Path, total: int, headers) -> Dict:
+        """Hash a segmented download once every range is in, and move it into place."""
+        digest = self._hash_part(part_path, total, headers)
+        return self._complete_part(part_path, filepath, total, digest)
+
+    def _fetch_segment(
+        self,
+        url: str,
+        fd: int,
+        segment: Dict,
+        validator: Optional[str],
+        stop: threading.Event,
+        clock: TransferClock,
+    ) -> None:
+        """Download one byte range, retrying transient failures from where it got to."""
+        attempt = 0
 
         while True:
-            items, cursor = self.client.fetch_board_items(BOARD_ID, limit=limit, cursor=cursor)
+            try:
+                headers = self._segment_headers(segment, validator)
+                with self.session.get(url, stream=True, timeout=30, headers=headers) as response:
+                    response.raise_for_status()
+                    self._check_segment_response(response.status_code, response.headers, segment)
+                    response.raw.decode_content = True
+                    self._read_segment(response.raw, fd, segment, stop, clock)
+                return
+            except Exception as e:
+                delay = self._segment_retry_delay(e, attempt, stop)
+                if delay is None:
+                    stop.set()
+                    raise
+                attempt += 1
+                # Wake early if another range fails or the run is stopping
+                deadline = time.monotonic() + delay
+                while not stop.wait(min(0.1, max(0.0, deadline - time.monotonic()))):
+                    self._check_stopping()
+                    if time.monotonic() >= deadline:
+                        break
+
+    def _fetch_segmented(
+        self,
+        url: str,
+        response,
+        part_path: Path,
+        filepath: Path,
+        total: int,
+        sniffer: ContentSniffer,
+        clock: TransferClock,
+    ) -> Dict:
+        """Download a large file as several byte ranges at once.
+
+        The first range is read from the response that's already open; the
+        others are requested in parallel, with If-Range so they all come from
+        the same version of the file. Each range is written at its offset in
+        the ``.part`` file. The SHA-256 is computed once every byte is in,
+        since the ranges arrive out of order.
+        """
+        validator = self._validator(response.headers)
+        segments = self._split_segments(total)
+        stop = threading.Event()
+        response.raw.decode_content = True
 
-            if not items:
+        fd = self._open_segmented(part_path, total)
+        try:
+            with ThreadPoolExecutor(len(segments) - 1, thread_name_prefix="segment") as pool:
+                futures = [
+                    pool.submit(self._fetch_segment, url, fd, segment, validator, stop, clock)
+                    for segment in segments[1:]
+                ]
+                try:
+                    try:
+                        self._read_segment(response.raw, fd, segments[0], stop, clock, sniffer)
+                    except Exception as e:
+                        if not self.retry_policy.is_retryable(e):
+                            raise
+                        # Carry on from where the first response stopped
+                        self._fetch_segment(url, fd, segments[0], validator, stop, clock)
+                except BaseException:
+                    stop.set()
+                    raise
+                for future in futures:
+                    future.result()
+        finally:
+            os.close(fd)
+
+        return self._finish_segmented(part_path, filepath, total, response.headers)
+
+    async def _iter_blocks_async(
+        self,
+        content: "aiohttp.StreamReader",
+        limit: Optional[int] = None,
+        sniffer: Optional[ContentSniffer] = None,
+    ) -> AsyncIterator[memoryview]:
+        """Gather a response body into ASYNC_WRITE_SIZE blocks as it arrives.
+
+        The bandwidth limit is applied and ``sniffer`` fed along the way.
+        Stops after ``limit`` bytes when given; the last block may be short.
+        The block is reused, so each must be written before the next.
+        """
+        block = memoryview(bytearray(ASYNC_WRITE_SIZE))
+        filled = 0
+
+        async for chunk in content.iter_any():
+            delay = self.limiter.reserve(len(chunk))
+            if delay > 0:
+                await asyncio.sleep(delay)
+            chunk = memoryview(chunk)
+            if limit is not None:
+                chunk = chunk[:limit]
+                limit -= len(chunk)
+            if sniffer:
+                sniffer.feed(chunk)
+            while chunk:
+                n = min(len(chunk), ASYNC_WRITE_SIZE - filled)
+                block[filled:filled + n] = chunk[:n]
+                filled += n
+                chunk = chunk[n:]
+                if filled == ASYNC_WRITE_SIZE:
+                    yield block
+                    filled = 0
+            if limit == 0:
                 break
 
-            # Filter by series (group title)
-            filtered_items = [
-                item
-                for item in items
-                if item.get("group", {}).get("title") == self.series_name
+        if filled:
+            yield block[:filled]
+
+    async def _read_segment_async(
+        self,
+        content: "aiohttp.StreamReader",
+        fd: int,
+        segment: Dict,
+        clock: TransferClock,
+        sniffer: Optional[ContentSniffer] = None,
+    ) -> None:
+        """Coroutine version of _read_segment, writing ASYNC_WRITE_SIZE blocks in a thread."""
+        blocks = self._iter_blocks_async(content, segment["end"] - segment["pos"], sniffer)
+        async for block in blocks:
+            written = time.perf_counter()
+            await asyncio.to_thread(self._pwrite_all, fd, block, segment["pos"])
+            clock.add_disk_write(time.perf_counter() - written)
+            segment["pos"] += len(block)
+
+        if segment["pos"] < segment["end"]:
+            raise IncompleteDownload(f"Segment ended at byte {segment['pos']} of {segment['end']}")
+
+    async def _fetch_segment_async(
+        self,
+        session: "aiohttp.ClientSession",
+        url: str,
+        fd: int,
+        segment: Dict,
+        validator: Optional[str],
+        clock: TransferClock,
+    ) -> None:
+        """Coroutine version of _fetch_segment."""
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=30)
+        attempt = 0
+
+        while True:
+            try:
+                headers = self._segment_headers(segment, validator)
+                async with session.get(url, timeout=timeout, headers=headers) as response:
+                    response.raise_for_status()
+                    self._check_segment_response(response.status, response.headers, segment)
+                    await self._read_segment_async(response.content, fd, segment, clock)
+                return
+            except Exception as e:
+                delay = self._segment_retry_delay(e, attempt)
+                if delay is None:
+                    raise
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    async def _fetch_segmented_async(
+        self,
+        session: "aiohttp.ClientSession",
+        url: str,
+        response: "aiohttp.ClientResponse",
+        part_path: Path,
+        filepath: Path,
+        total: int,
+        sniffer: ContentSniffer,
+        clock: TransferClock,
+    ) -> Dict:
+        """Coroutine version of _fetch_segmented."""
+        validator = self._validator(response.headers)
+        segments = self._split_segments(total)
+
+        fd = await asyncio.to_thread(self._open_segmented, part_path, total)
+        try:
+            tasks = [
+                asyncio.create_task(
+                    self._fetch_segment_async(session, url, fd, segment, validator, clock)
+                )
+                for segment in segments[1:]
             ]
+            try:
+                try:
+                    await self._read_segment_async(
+                        response.content, fd, segments[0], clock, sniffer
+                    )
+                except Exception as e:
+                    if not self.retry_policy.is_retryable(e):
+                        raise
+                    # Carry on from where the first response stopped
+                    await self._fetch_segment_async(
+                        session, url, fd, segments[0], validator, clock
+                    )
+                await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+        finally:
+            await asyncio.to_thread(os.close, fd)
+
+        return await asyncio.to_thread(
+            self._finish_segmented, part_path, filepath, total, response.headers
+        )
 
-            all_items.extend(filtered_items)
+    @staticmethod
+    def _clocked(result: Dict, clock: TransferClock, received: int) -> Dict:
+        """Add an attempt's stage timings and bytes received to its result."""
+        result["timings"] = clock.stages()
+        result["received"] = received
+        return result
 
-            print(
-                f"Page {page}: Fetched {len(filtered_items)} practices (Total: {len(all_items)})"
+    def _promote_part(self, part_path: Path, filepath: Path, total: int) -> Dict:
+        """Move a partial file that already has every byte into place."""
+        return self._complete_part(part_path, filepath, total)
+
+    def _discard_bad_part(self, error: Exception, filepath: Path) -> None:
+        """Throw away a partial file that turned out not to be the file at all."""
+        if isinstance(error, UnexpectedContent):
+            self._discard_part(self._part_path(filepath))
+
+    @staticmethod
+    def _url_expired(error: Exception) -> bool:
+        """Whether a download failed as if its signed URL had expired.
+
+        Expired URLs are refused, or answered with an error page in place
+        of the file.
+        """
+        if isinstance(error, UnexpectedContent):
+            return error.markup
+        status, _ = RetryPolicy._status(error)
+        return status in EXPIRED_URL_STATUS_CODES
+
+    def _refresh_url(self, job: Dict, error: Exception) -> bool:
+        """Resolve a new download URL, once per job, if the old one looks expired."""
+        if job["url_refreshed"] or not self._url_expired(error):
+            return False
+
+        job["url_refreshed"] = True
+        self._log(f"    ↻ {self._file_label(job)}: {error}, fetching a new download URL")
+        asset_id = str(job["file_info"]["assetId"])
+        url = self.client.fetch_asset_urls([asset_id]).get(asset_id)
+        if not url:
+            return False
+        job["file_url"] = url
+        job["retries"] += 1
+        return True
+
+    def _retry_delay(self, job: Dict, filepath: Path, error: Exception) -> Optional[float]:
+        """Decide how a download carries on after a failed attempt.
+
+        Returns 0 to retry at once with a fresh URL, the wait before the next
+        retry, or None once the download has failed.
+        """
+        self._discard_bad_part(error, filepath)
+        if self._refresh_url(job, error):
+            return 0.0
+
+        delay = self.retry_policy.backoff(error, job["retries"], "download")
+        if delay is None:
+            self._log(f"    ✗ Error downloading {filepath.name}: {error}")
+            return None
+        job["retries"] += 1
+        self._log(f"    ↻ {self._file_label(job)}: {error}, retrying in {delay:.1f}s")
+        return delay
+
+    def _sniff_part(self, part_path: Path, kind: Optional[str], start: int) -> ContentSniffer:
+        """Start checking a download's kind, with any bytes already in a partial file."""
+        sniffer = ContentSniffer(kind)
+        if start:
+            with open(part_path, "rb") as f:
+                sniffer.feed(f.read(SNIFF_SIZE))
+        return sniffer
+
+    def _timed(self, result: Dict, started: float) -> Dict:
+        """Add a finished download's stage timings to the run's, and its duration."""
+        for stage, seconds in result["timings"].items():
+            self.timings.add(stage, seconds)
+        # Includes failed attempts and the waits between them
+        result["duration"] = time.perf_counter() - started
+        return result
+
+    def _download_file(self, job: Dict, filepath: Path) -> Optional[Dict]:
+        """Download a job's file to filepath, retrying transient failures.
+
+        Each retry resumes from the ``.part`` file. The number of retries is
+        kept in ``job["retries"]`` for the report. If the download URL looks
+        expired, a new one is resolved, once.
+
+        Returns the file's size, SHA-256 and timings, or None if the download
+        failed.
+        """
+        job["retries"] = 0
+        job["url_refreshed"] = False
+        started = time.perf_counter()
+
+        while True:
+            try:
+                result = self._fetch_file(
+                    job["file_url"],
+                    filepath,
+                    job["file_info"]["assetId"],
+                    job["col_info"].get("kind"),
+                )
+                return self._timed(result, started)
+            except DownloadCancelled:
+                raise
+            except Exception as e:
+                delay = self._retry_delay(job, filepath, e)
+                if delay is None:
+                    return None
+                if self._stopping.wait(delay):
+                    raise DownloadCancelled("Download stopped")
+
+    async def _download_file_async(
+        self, session: "aiohttp.ClientSession", job: Dict, filepath: Path
+    ) -> Optional[Dict]:
+        """Coroutine version of _download_file for the async engine."""
+        job["retries"] = 0
+        job["url_refreshed"] = False
+        started = time.perf_counter()
+
+        while True:
+            try:
+                result = await self._fetch_file_async(
+                    session,
+                    job["file_url"],
+                    filepath,
+                    job["file_info"]["assetId"],
+                    job["col_info"].get("kind"),
+                )
+                return self._timed(result, started)
+            except Exception as e:
+                delay = await asyncio.to_thread(self._retry_delay, job, filepath, e)
+                if delay is None:
+                    return None
+                await asyncio.sleep(delay)
+
+    def _start_attempt(self, part_path: Path, asset_id) -> Tuple[int, Dict[str, str]]:
+        """Find where an attempt resumes, returning the offset and the request headers."""
+        offset, validator = self._open_part(part_path, asset_id)
+        return offset, self._range_headers(offset, validator)
+
+    def _unsatisfiable(
+        self, part_path: Path, filepath: Path, offset: int, headers
+    ) -> Optional[Dict]:
+        """Handle a 416 to a resume request.
+
+        Returns the finished file's result if every byte arrived before the
+        last run stopped. Otherwise the partial file doesn't fit this asset
+        any more, so it is discarded and None says to start over.
+        """
+        if self._unsatisfiable_size(headers) == offset:
+            return self._promote_part(part_path, filepath, offset)
+        self._discard_part(part_path)
+        return None
+
+    def _start_body(
+        self,
+        part_path: Path,
+        filepath: Path,
+        asset_id,
+        kind: Optional[str],
+        status_code: int,
+        headers,
+        offset: int,
+    ) -> Tuple[int, Optional[int], ContentSniffer, bool]:
+        """Get ready to store a response body.
+
+        Returns where the body starts and the file's expected size (see
+        _resume_point), the sniffer checking its kind, and whether to fetch
+        it in ranges instead (see _can_segment).
+        """
+        start, total = self._resume_point(status_code, headers, offset)
+
+        # Create parent directory if it doesn't exist
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        sniffer = self._sniff_part(part_path, kind, start)
+        segmented = False
+        if not start:
+            segmented = self._can_segment(headers, total)
+            self._save_part_info(part_path, asset_id, headers, segmented)
+        return start, total, sniffer, segmented
+
+    def _open_body(
+        self, part_path: Path, start: int, total: Optional[int], headers
+    ) -> Tuple[BinaryIO, FileDigest]:
+        """Open the partial file for a response body, appending when resuming.
+
+        Returns the unbuffered file, with room set aside for the rest of the
+        body, and the digest fed with any bytes already in it.
+        """
+        digest = self._hash_part(part_path, start, headers, partial=bool(start))
+        f = open(part_path, "ab" if start else "wb", buffering=0)
+        try:
+            if total:
+                preallocate(f.fileno(), start, total - start)
+        except BaseException:
+            f.close()
+            raise
+        return f, digest
+
+    def _fetch_file(
+        self, url: str, filepath: Path, asset_id, kind: Optional[str] = None
+    ) -> Dict:
+        """Make one attempt at downloading a file from URL to filepath.
+
+        Bytes go to a ``.part`` file next to the target, which is renamed into
+        place only once complete. A ``.part`` file left by an interrupted run
+        of the same asset is resumed with an HTTP Range request when the
+        server supports it.
+
+        Large files from servers that accept range requests are fetched
+        as several ranges at once (see _fetch_segmented).
+
+        The first bytes are checked against the ``kind`` of file expected
+        (see ContentSniffer) before anything is written.
+
+        The SHA-256, and any checksum the host sent, are computed while
+        streaming, so verifying a file needs no second read of it.
+
+        Returns the file's size, SHA-256, the checks it passed, the bytes
+        received and the time spent in each stage (see TransferClock).
+        Raises if the download failed or the file didn't verify.
+        """
+        part_path = self._part_path(filepath)
+        offset, headers = self._start_attempt(part_path, asset_id)
+        clock = TransferClock()
+
+        # Closing the response hands the connection back to the pool
+        with self.session.get(url, stream=True, timeout=30, headers=headers) as response:
+            clock.response_started()
+            if offset and response.status_code == 416:
+                result = self._unsatisfiable(part_path, filepath, offset, response.headers)
+                if result is None:
+                    return self._fetch_file(url, filepath, asset_id, kind)
+                return self._clocked(result, clock, 0)
+
+            response.raise_for_status()
+            start, total, sniffer, segmented = self._start_body(
+                part_path, filepath, asset_id, kind,
+                response.status_code, response.headers, offset,
             )
+            if segmented:
+                result = self._fetch_segmented(
+                    url, response, part_path, filepath, total, sniffer, clock
+                )
+                return self._clocked(result, clock, total)
+
+            # Reads go straight into a reused buffer and on to an unbuffered
+            # file, so each block is copied as little as possible
+            f, digest = self._open_body(part_path, start, total, response.headers)
+            raw = response.raw
+            raw.decode_content = True
+            buffer = self._read_buffer()
+            read_size = READ_SIZE_MIN
+            with f:
+                while True:
+                    self._check_stopping()
+                    n = raw.readinto(buffer[:read_size])
+                    if not n:
+                        break
+                    sniffer.feed(buffer[:n])
+                    written = time.perf_counter()
+                    self._write_block(f, digest, buffer[:n])
+                    clock.add_disk_write(time.perf_counter() - written)
+                    self._throttle(n)
+                    if n == read_size:
+                        read_size = min(read_size * 2, READ_SIZE_MAX)
+                sniffer.check()
+
+        result = self._complete_part(part_path, filepath, total, digest)
+        return self._clocked(result, clock, result["size"] - start)
+
+    async def _fetch_file_async(
+        self,
+        session: "aiohttp.ClientSession",
+        url: str,
+        filepath: Path,
+        asset_id,
+        kind: Optional[str] = None,
+    ) -> Dict:
+        """Make one attempt at a download without blocking the event loop.
+
+        Works like _fetch_file, resuming ``.part`` files. Network reads
+        happen on the loop; file writes are gathered into ASYNC_WRITE_SIZE
+        blocks and handed to a worker thread.
+        """
+        part_path = self._part_path(filepath)
+        offset, headers = await asyncio.to_thread(self._start_attempt, part_path, asset_id)
+        clock = TransferClock()
+
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=30)
+        async with session.get(url, timeout=timeout, headers=headers) as response:
+            clock.response_started()
+            if offset and response.status == 416:
+                result = await asyncio.to_thread(
+                    self._unsatisfiable, part_path, filepath, offset, response.headers
+                )
+                if result is None:
+                    return await self._fetch_file_async(session, url, filepath, asset_id, kind)
+                return self._clocked(result, clock, 0)
+
+            response.raise_for_status()
+            start, total, sniffer, segmented = await asyncio.to_thread(
+                self._start_body, part_path, filepath, asset_id, kind,
+                response.status, response.headers, offset,
+            )
+            if segmented:
+                result = await self._fetch_segmented_async(
+                    session, url, response, part_path, filepath, total, sniffer, clock
+                )
+                return self._clocked(result, clock, total)
+
+            # Hashing and writing each gathered block happen off the loop
+            f, digest = await asyncio.to_thread(
+                self._open_body, part_path, start, total, response.headers
+            )
+            try:
+                async for block in self._iter_blocks_async(response.content, sniffer=sniffer):
+                    written = time.perf_counter()
+                    await asyncio.to_thread(self._write_block, f, digest, block)
+                    clock.add_disk_write(time.perf_counter() - written)
+                sniffer.check()
+            finally:
+                await asyncio.to_thread(f.close)
+
+        result = await asyncio.to_thread(
+            self._complete_part, part_path, filepath, total, digest
+        )
+        return self._clocked(result, clock, result["size"] - start)
+
+    def _filter_series_items(self, items: List[Dict]) -> List[Dict]:
+        """Keep only the board items that belong to this series."""
+        return [
+            item
+            for item in items
+            if item.get("group", {}).get("title") == self.series_name
+        ]
+
+    def _iter_board_pages(
+        self,
+        group_id: Optional[str] = None,
+        query_params: Optional[Dict] = None,
+        column_ids: Optional[List[str]] = None,
+    ) -> Iterator[List[Dict]]:
+        """Yield board items one page at a time, following the cursor.
+
+        Items carry the downloader's columns unless ``column_ids`` is given.
+        """
+        cursor = None
+
+        while True:
+            with self.timings.measure("board_page"), self.profiler.phase("board_page"):
+                items, cursor = self.client.fetch_board_items(
+                    BOARD_ID,
+                    limit=ITEMS_PAGE_LIMIT,
+                    cursor=cursor,
+                    group_id=group_id,
+                    column_ids=self.column_ids if column_ids is None else column_ids,
+                    query_params=query_params,
+                )
+
+            if not items:
+                break
+
+            yield items
 
             # If no cursor returned, we've reached the end
             if not cursor:
                 break
 
-            page += 1
+    async def _iter_board_pages_async(
+        self,
+        client: AsyncMondayAPIClient,
+        group_id: Optional[str] = None,
+        query_params: Optional[Dict] = None,
+        column_ids: Optional[List[str]] = None,
+    ) -> AsyncIterator[List[Dict]]:
+        """Coroutine version of _iter_board_pages for the async engine."""
+        cursor = None
 
-        print(f"\n✓ Found {len(all_items)} total practices\n")
-        return all_items
+        while True:
+            with self.timings.measure("board_page"), self.profiler.phase("board_page"):
+                items, cursor = await client.fetch_board_items(
+                    BOARD_ID,
+                    limit=ITEMS_PAGE_LIMIT,
+                    cursor=cursor,
+                    group_id=group_id,
+                    column_ids=self.column_ids if column_ids is None else column_ids,
+                    query_params=query_params,
+                )
 
-    def download_practice_files(self, practice: Dict, practice_number: int) -> None:
-        """Download all files for a single practice."""
-        practice_name = practice.get("name", "Unknown")
-        sanitized_name = self._sanitize_filename(practice_name)
+            if not items:
+                break
 
-        print(f"\n[{practice_number:03d}_{practice_name}]")
+            yield items
 
-        column_values = {
-            col["id"]: col.get("value") for col in practice.get("column_values", [])
+            # If no cursor returned, we've reached the end
+            if not cursor:
+                break
+
+    def _fetch_changes(
+        self, query_params: Dict, group_id: Optional[str] = None
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """Fetch the items changed since a sync, and a cheap listing of current items.
+
+        Changed items are looked for board-wide to catch moves between series.
+        The listing, without column values, covers ``group_id`` or else the
+        whole board, and catches deletions.
+        """
+        changed_items = [
+            item
+            for items in self._iter_board_pages(query_params=query_params)
+            for item in items
+        ]
+        listing = [
+            item
+            for items in self._iter_board_pages(group_id=group_id, column_ids=[])
+            for item in items
+        ]
+        return changed_items, listing
+
+    async def _fetch_changes_async(
+        self, client: AsyncMondayAPIClient, query_params: Dict, group_id: Optional[str] = None
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """Coroutine version of _fetch_changes."""
+        changed_items = [
+            item
+            async for items in self._iter_board_pages_async(client, query_params=query_params)
+            for item in items
+        ]
+        listing = [
+            item
+            async for items in self._iter_board_pages_async(
+                client, group_id=group_id, column_ids=[]
+            )
+            for item in items
+        ]
+        return changed_items, listing
+
+    def _load_snapshot(self, group_id: str) -> Optional[Dict]:
+        """Load the series' board snapshot from the last sync, if usable."""
+        try:
+            with open(self.output_dir / SNAPSHOT_FILENAME, encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if snapshot.get("group_id") != group_id or "synced_at" not in snapshot:
+            return None
+        return snapshot
+
+    @staticmethod
+    def _changed_since_params(snapshot: Dict) -> Dict:
+        """Build an items_page filter for items updated since a snapshot.
+
+        Monday.com compares dates by day, so the filter starts a day early
+        to allow for time zones. Items that didn't really change are
+        dropped later by comparing ``updated_at``.
+        """
+        synced_at = datetime.fromisoformat(snapshot["synced_at"])
+        since = (synced_at - timedelta(days=1)).date().isoformat()
+        return {
+            "rules": [{
+                "column_id": "__last_updated__",
+                "compare_value": ["EXACT", since],
+                "operator": "greater_than_or_equals",
+                "compare_attribute": "UPDATED_AT",
+            }]
         }
 
-        files_found = False
+    def _apply_changes(
+        self, snapshot: Dict, changed_items: List[Dict], group_id: str
+    ) -> Optional[List[Tuple[int, Dict]]]:
+        """Merge changed board items into a snapshot.
 
-        for col_id, col_info in FILE_COLUMNS.items():
-            if col_id not in column_values:
-                continue
+        Returns the numbered practices that changed, or None if practices
+        joined or left the series. Numbering follows board order, so that
+        needs a full scan.
+        """
+        numbers = {item["id"]: n for n, item in enumerate(snapshot["items"], start=1)}
+        changed = []
 
-            file_info = self._extract_file_info(column_values[col_id])
+        for item in changed_items:
+            in_series = item.get("group", {}).get("id") == group_id
+            number = numbers.get(item.get("id"))
 
-            if not file_info or not file_info.get("assetId"):
+            if number is None:
+                if in_series:
+                    return None
                 continue
 
-            files_found = True
-            self.stats["total_files"] += 1
+            if not in_series:
+                return None
 
-            # Fetch the download URL from Monday.com using the asset ID
-            file_url = self.client.fetch_asset_url(file_info["assetId"])
-
-            if not file_url:
-                print(f"  ✗ {col_info['type']}: Could not fetch download URL")
-                self.stats["failed"] += 1
-                # Record failed URL fetch
-                self.download_records.append({
-                    "practice_number": practice_number,
-                    "practice_name": practice_name,
-                    "file_type": col_info['type'],
-                    "original_filename": file_info.get("name", "N/A"),
-                    "downloaded_filename": "N/A",
-                    "status": "Failed - Could not fetch URL",
-                    "file_size_mb": "N/A",
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                })
+            if item.get("updated_at") == snapshot["items"][number - 1].get("updated_at"):
                 continue
 
-            # Determine file extension
-            extension = self._get_file_extension(
-                file_info.get("name", ""), file_url
-            )
+            snapshot["items"][number - 1] = item
+            changed.append((number, item))
 
-            # Build filename
-            filename = f"{practice_number:03d}_{sanitized_name}_{col_info['name']}{extension}"
-            filepath = self.output_dir / filename
+        return changed
 
-            # Check if file already exists
-            if filepath.exists():
-                print(f"  ○ {col_info['type']}: Already exists, skipping")
-                self.stats["skipped"] += 1
-                file_size_mb = round(filepath.stat().st_size / (1024 * 1024), 2)
-                # Record skipped file
-                self.download_records.append({
-                    "practice_number": practice_number,
-                    "practice_name": practice_name,
-                    "file_type": col_info['type'],
-                    "original_filename": file_info.get("name", "N/A"),
-                    "downloaded_filename": filename,
-                    "status": "Skipped - Already exists",
-                    "file_size_mb": file_size_mb,
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                })
-                continue
+    def _save_snapshot(self) -> None:
+        """Write the pending board snapshot, but only after a clean run.
 
-            # Download file
-            print(f"  ↓ {col_info['type']}: Downloading...", end=" ")
-            if self._download_file(file_url, filepath):
-                print("✓")
-                self.stats["downloaded"] += 1
-                file_size_mb = round(filepath.stat().st_size / (1024 * 1024), 2)
-                # Record successful download
-                self.download_records.append({
-                    "practice_number": practice_number,
-                    "practice_name": practice_name,
-                    "file_type": col_info['type'],
-                    "original_filename": file_info.get("name", "N/A"),
-                    "downloaded_filename": filename,
-                    "status": "Downloaded",
-                    "file_size_mb": file_size_mb,
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                })
-            else:
-                self.stats["failed"] += 1
-                # Record failed download
-                self.download_records.append({
-                    "practice_number": practice_number,
-                    "practice_name": practice_name,
-                    "file_type": col_info['type'],
-                    "original_filename": file_info.get("name", "N/A"),
-                    "downloaded_filename": filename,
-                    "status": "Failed - Download error",
-                    "file_size_mb": "N/A",
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                })
-
-        if not files_found:
-            print("  (no files available)")
+        If any file failed, the old snapshot is removed instead so the next
+        incremental run rescans the whole series and retries it.
+        """
+        snapshot, self._pending_snapshot = self._pending_snapshot, None
+        if snapshot is None:
+            return
 
-    def run(self) -> None:
-        """Main download process."""
-        print(f"Downloading files to: {self.output_dir}")
-        print("=" * 60)
+        snapshot_path = self.output_dir / SNAPSHOT_FILENAME
+        if self.stats["failed"]:
+            snapshot_path.unlink(missing_ok=True)
+            print("\nSome files failed, so the next --incremental run will rescan the series")
+            return
 
-        # Fetch practices
-        practices = self.fetch_practices()
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = snapshot_path.with_name(snapshot_path.name + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+        os.replace(temp_path, snapshot_path)
 
-        if not practices:
-            print(f"No practices found for series: {self.series_name}")
+    def _incremental_practices(
+        self,
+        snapshot: Optional[Dict],
+        group_id: str,
+        changed_items: List[Dict],
+        item_ids: List[str],
+    ) -> Optional[List[Tuple[int, Dict]]]:
+        """Work out which practices to sync incrementally, or None for a full scan.
+
+        ``item_ids`` lists the series' items now on the board, in order.
+        Deleted and archived items never show up as changed, so any
+        difference from the snapshot's items means the numbering moved.
+        """
+        if item_ids != [item.get("id") for item in snapshot["items"]]:
+            self._log(f"Practices were added, removed or reordered in {self.series_name}, rescanning it")
+            return None
+
+        practices = self._apply_changes(snapshot, changed_items, group_id)
+        if practices is None:
+            self._log(f"Practices were added to or moved out of {self.series_name}, rescanning it")
+            return None
+
+        self.series_size = len(snapshot["items"])
+        self._log(
+            f"Incremental sync of {self.series_name}: {len(practices)} of {self.series_size} practices "
+            f"changed since {snapshot['synced_at']}\n"
+        )
+        return practices
+
+    def _sync_changes(
+        self,
+        snapshot: Dict,
+        sync_started: str,
+        changed_items: List[Dict],
+        listing: List[Dict],
+    ) -> Optional[List[Tuple[int, Dict]]]:
+        """Sync the series from its snapshot, or return None if it needs a full scan.
+
+        ``changed_items`` and ``listing`` come from _fetch_changes. On success
+        the updated snapshot is kept to be saved after the run.
+        """
+        item_ids = [
+            item.get("id")
+            for item in listing
+            if item.get("group", {}).get("id") == self.group_id
+        ]
+        practices = self._incremental_practices(snapshot, self.group_id, changed_items, item_ids)
+        if practices is not None:
+            snapshot["synced_at"] = sync_started
+            self._pending_snapshot = snapshot
+        return practices
+
+    def _begin_sync(self) -> str:
+        """Announce the board being read, returning when the sync started."""
+        self._log("Fetching practices from Monday.com...")
+        return datetime.now(timezone.utc).isoformat()
+
+    def _open_series(self, group_ids: Dict[str, str]) -> Tuple[Optional[str], Optional[Dict]]:
+        """Find the series' group, and its snapshot when syncing incrementally.
+
+        Returns ``(group_id, snapshot)``; the group ID is None, and reported,
+        if the series has no group on the board.
+        """
+        group_id = self.group_id = group_ids.get(self.series_name)
+        if not group_id:
+            self._log(f"\n✗ No group named '{self.series_name}' on the board\n")
+            return None, None
+        return group_id, self._load_snapshot(group_id) if self.incremental else None
+
+    def _start_scan(self) -> None:
+        """Reset the practice count before a full scan of the series."""
+        self.series_size = 0
+        self._scanned_items = []
+
+    def _number_practices(self, items: List[Dict]) -> List[Tuple[int, Dict]]:
+        """Number the next page of the series' items, continuing a full scan."""
+        numbered = list(enumerate(items, start=self.series_size + 1))
+        self.series_size += len(items)
+        if self.incremental:
+            self._scanned_items.extend(items)
+        return numbered
+
+    def _scan_page(self, items: List[Dict], page: int) -> List[Tuple[int, Dict]]:
+        """Number one page of a full scan of the series."""
+        # Guard against items from other groups (series)
+        numbered = self._number_practices(self._filter_series_items(items))
+        self._log(f"Page {page}: Fetched {len(numbered)} practices (Total: {self.series_size})")
+        return numbered
+
+    def _finish_scan(self, sync_started: str) -> None:
+        """Keep the fully scanned series as the snapshot for incremental runs."""
+        if self.incremental:
+            self._pending_snapshot = {
+                "group_id": self.group_id,
+                "synced_at": sync_started,
+                "items": self._scanned_items,
+            }
+        self._scanned_items = []
+
+    def iter_practice_pages(self) -> Iterator[List[Tuple[int, Dict]]]:
+        """Yield the series' practices one board page at a time.
+
+        Each practice comes with its number in the series (its position on
+        the board). In incremental mode only the practices changed since
+        the last sync are yielded, when that can be done safely.
+        """
+        sync_started = self._begin_sync()
+        group_id, snapshot = self._open_series(self.client.fetch_group_ids(BOARD_ID))
+        if not group_id:
+            return
+
+        if snapshot:
+            changes = self._fetch_changes(self._changed_since_params(snapshot), group_id)
+            practices = self._sync_changes(snapshot, sync_started, *changes)
+            if practices is not None:
+                if practices:
+                    yield practices
+                return
+
+        self._start_scan()
+        for page, items in enumerate(self._iter_board_pages(group_id=group_id), start=1):
+            yield self._scan_page(items, page)
+        self._log(f"\n✓ Found {self.series_size} total practices\n")
+        self._finish_scan(sync_started)
+
+    async def iter_practice_pages_async(
+        self, client: AsyncMondayAPIClient
+    ) -> AsyncIterator[List[Tuple[int, Dict]]]:
+        """Coroutine version of iter_practice_pages for the async engine."""
+        sync_started = self._begin_sync()
+        group_id, snapshot = self._open_series(await client.fetch_group_ids(BOARD_ID))
+        if not group_id:
             return
 
-        # Create output directory
+        if snapshot:
+            changes = await self._fetch_changes_async(
+                client, self._changed_since_params(snapshot), group_id
+            )
+            practices = self._sync_changes(snapshot, sync_started, *changes)
+            if practices is not None:
+                if practices:
+                    yield practices
+                return
+
+        self._start_scan()
+        page = 1
+        async for items in self._iter_board_pages_async(client, group_id=group_id):
+            yield self._scan_page(items, page)
+            page += 1
+        self._log(f"\n✓ Found {self.series_size} total practices\n")
+        self._finish_scan(sync_started)
+
+    def _iter_job_batches(self) -> Iterator[List[Dict]]:
+        """Yield planned jobs, with URLs resolved, a board page at a time."""
+        for practices in self.iter_practice_pages():
+            # Plan the page's files from item metadata, then resolve URLs in
+            # batched queries for just the files that are missing locally
+            jobs = self._plan_page(practices)
+            self.resolve_job_urls(jobs)
+            yield jobs
+
+    async def _iter_job_batches_async(self, client: AsyncMondayAPIClient) -> AsyncIterator[List[Dict]]:
+        """Coroutine version of _iter_job_batches for the async engine."""
+        async for practices in self.iter_practice_pages_async(client):
+            jobs = await asyncio.to_thread(self._plan_page, practices)
+            await self.resolve_job_urls_async(client, jobs)
+            yield jobs
+
+    def fetch_practices(self) -> List[Dict]:
+        """Fetch all practices in the series' group on the board."""
+        return [
+            practice
+            for practices in self.iter_practice_pages()
+            for _, practice in practices
+        ]
+
+    def plan_practice_files(self, practice: Dict, practice_number: int) -> List[Dict]:
+        """Build one download job per file available on a practice.
+
+        Target filenames come from the item metadata where possible. Download
+        URLs are filled in later, and only for files missing locally.
+        """
+        practice_name = practice.get("name", "Unknown")
+
+        jobs = []
+        for col_id, col_info, file_info in self._get_practice_files(practice):
+            job = {
+                "practice_number": practice_number,
+                "practice_name": practice_name,
+                "sanitized_name": self._sanitize_filename(practice_name),
+                "column_id": col_id,
+                "col_info": col_info,
+                "file_info": file_info,
+                "file_url": None,
+            }
+            job["filename"] = self._build_filename(job)
+            jobs.append(job)
+
+        return jobs
+
+    def _plan_page(self, practices: List[Tuple[int, Dict]]) -> List[Dict]:
+        """Plan a page of practices, making sure the series folder exists."""
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        return self.plan_jobs(practices)
+
+    def plan_jobs(self, practices: List[Tuple[int, Dict]]) -> List[Dict]:
+        """Plan download jobs for a list of (practice number, practice) pairs."""
+        with self.profiler.phase("plan"):
+            return [
+                job
+                for idx, practice in practices
+                for job in self.plan_practice_files(practice, idx)
+            ]
+
+    def _build_filename(self, job: Dict, file_url: Optional[str] = None) -> Optional[str]:
+        """Build the standardized filename for a job.
+
+        When the Monday.com filename has no extension and there is no URL yet,
+        the extension of the file the manifest recorded for the asset is used.
+        Returns None if there is no such file either.
+        """
+        stem = f"{job['practice_number']:03d}_{job['sanitized_name']}_{job['col_info']['name']}"
+        original_name = job["file_info"].get("name") or ""
+        if "." not in original_name and not file_url:
+            entry = self.manifest.get(job["file_info"]["assetId"])
+            recorded = Path(entry["path"]).name if entry else ""
+            extension = recorded[len(stem):]
+            if not recorded.startswith(stem) or extension != Path(recorded).suffix:
+                return None
+            return recorded
+
+        # Determine file extension
+        extension = self._get_file_extension(original_name, file_url)
 
-        # Download files for each practice
-        for idx, practice in enumerate(practices, start=1):
-            self.download_practice_files(practice, idx)
+        return f"{stem}{extension}"
 
-        # Print summary
-        self.print_summary()
+    def _manifest_path(self, filepath: Path) -> str:
+        """Path of a file as stored in the manifest, relative to the output root."""
+        return filepath.relative_to(self.root_dir).as_posix()
 
-        # Generate CSV report
-        self.generate_csv_report()
+    def _is_up_to_date(self, job: Dict, filename: str) -> bool:
+        """Check whether a job's file is already on disk and complete.
 
-    def generate_csv_report(self) -> None:
-        """Generate a CSV report of all download attempts."""
-        if not self.download_records:
+        Files the manifest knows about must match its recorded size and
+        belong to the same asset. Files from before the manifest existed
+        only need to be non-empty.
+        """
+        filepath = self.output_dir / filename
+        try:
+            size = filepath.stat().st_size
+        except OSError:
+            return False
+
+        if not size:
+            return False
+
+        path = self._manifest_path(filepath)
+        entry = self.manifest.get(job["file_info"]["assetId"])
+        if entry and entry["path"] == path:
+            # A size mismatch means the file was truncated or changed on disk
+            return entry["size"] == size
+
+        owner = self.manifest.get_by_path(path)
+        if owner:
+            # The column now points at a different asset, so this file is stale
+            return False
+
+        return True
+
+    def _jobs_needing_urls(self, jobs: List[Dict]) -> List[Dict]:
+        """Select the jobs whose files are missing, truncated or out of date."""
+        return [
+            job
+            for job in jobs
+            if not job["filename"] or not self._is_up_to_date(job, job["filename"])
+        ]
+
+    def _apply_asset_urls(
+        self, jobs: List[Dict], asset_urls: Dict[str, str], errors: Dict[str, str]
+    ) -> None:
+        """Attach resolved download URLs, or why they failed, to their jobs."""
+        # Keep the first line of each error; the rest is the response body
+        reasons = {asset_id: error.splitlines()[0] for asset_id, error in errors.items() if error}
+
+        for job in jobs:
+            asset_id = str(job["file_info"]["assetId"])
+            job["file_url"] = asset_urls.get(asset_id)
+            job["url_error"] = reasons.get(asset_id)
+
+        if reasons:
+            for reason in dict.fromkeys(reasons.values()):
+                failed = sum(1 for error in reasons.values() if error == reason)
+                self._log(f"✗ Could not resolve {failed} download URLs: {reason}")
+        self._log(f"✓ Resolved {len(asset_urls)} download URLs")
+
+    def _pending_urls(self, jobs: List[Dict]) -> List[Dict]:
+        """Select and announce the jobs whose download URLs need resolving."""
+        if not jobs:
+            return []
+
+        pending = self._jobs_needing_urls(jobs)
+        if not pending:
+            self._log("All files already downloaded, no URLs to resolve")
+        else:
+            self._log(f"Resolving download URLs for {len(pending)} of {len(jobs)} files...")
+        return pending
+
+    def resolve_job_urls(self, jobs: List[Dict]) -> None:
+        """Resolve download URLs, in batched queries, for files missing locally."""
+        pending = self._pending_urls(jobs)
+        if not pending:
             return
 
-        # Create CSV filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        csv_filename = f"download_report_{self._sanitize_filename(self.series_name)}_{timestamp}.csv"
-        csv_filepath = self.output_dir / csv_filename
+        errors = {}
+        with self.timings.measure("url_resolve"), self.profiler.phase("url_resolve"):
+            asset_urls = self.client.fetch_asset_urls(
+                [job["file_info"]["assetId"] for job in pending], errors
+            )
+        self._apply_asset_urls(pending, asset_urls, errors)
+
+    async def resolve_job_urls_async(self, client: AsyncMondayAPIClient, jobs: List[Dict]) -> None:
+        """Coroutine version of resolve_job_urls for the async engine."""
+        pending = await asyncio.to_thread(self._pending_urls, jobs)
+        if not pending:
+            return
+
+        errors = {}
+        with self.timings.measure("url_resolve"), self.profiler.phase("url_resolve"):
+            asset_urls = await client.fetch_asset_urls(
+                [job["file_info"]["assetId"] for job in pending], errors
+            )
+        self._apply_asset_urls(pending, asset_urls, errors)
+
+    def _log(self, message: str = "", end: str = "\n") -> None:
+        """Print a console message without interleaving with other workers."""
+        with self._lock:
+            print(message, end=end, flush=True)
+
+    def _file_label(self, job: Dict) -> str:
+        """Label a file in console output.
+
+        Sequential runs print a header per practice, so the file type is
+        enough. Concurrent runs interleave practices and need the full name.
+        """
+        if not self.sequential:
+            return f"{self.label_prefix}{job['practice_number']:03d}_{job['practice_name']} {job['col_info']['type']}"
+        return job["col_info"]["type"]
+
+    def _record(
+        self,
+        job: Dict,
+        stat: str,
+        status: str,
+        downloaded_filename: str = "N/A",
+        result: Optional[Dict] = None,
+    ) -> None:
+        """Count a finished file and write its row to the CSV report.
+
+        ``result`` describes the file: its size and SHA-256, and for fresh
+        downloads the checks passed, bytes received and duration.
+        """
+        result = result or {}
+        size = result.get("size")
+        duration = result.get("duration")
+        with self._lock:
+            self.stats["total_files"] += 1
+            self.stats[stat] += 1
+            self.stats["bytes_received"] += result.get("received", 0)
+        self.report.write({
+            "Series": self.series_name,
+            "Practice Number": job["practice_number"],
+            "Practice Name": job["practice_name"],
+            "File Type": job["col_info"]["type"],
+            "Original Filename (Monday.com)": job["file_info"].get("name", "N/A"),
+            "Downloaded Filename": downloaded_filename,
+            "Status": status,
+            "File Size (MB)": round(size / (1024 * 1024), 2) if size is not None else "N/A",
+            "Size (bytes)": size if size is not None else "N/A",
+            "SHA-256": result.get("sha256") or "N/A",
+            "Verified": ", ".join(result.get("verified") or []) or "N/A",
+            "Retries": job.get("retries", 0),
+            "Duration (s)": round(duration, 3) if duration is not None else "N/A",
+            "Throughput (MB/s)": (
+                round(result["received"] / duration / (1024 * 1024), 2)
+                if duration else "N/A"
+            ),
+            "Timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        })
+
+    def _prepare_job(self, job: Dict) -> Optional[Tuple[str, Path]]:
+        """Work out where a planned file goes, or record why it's not needed.
+
+        Returns the target filename and path when the file should be
+        downloaded, or None when it was skipped or has no download URL.
+        """
+        file_url = job["file_url"]
+        label = self._file_label(job)
+        filename = job["filename"] or self._build_filename(job, file_url)
+
+        # Check if file already exists
+        if filename and self._is_up_to_date(job, filename):
+            filepath = self.output_dir / filename
+            self._log(f"  ○ {label}: Already exists, skipping")
+            size = filepath.stat().st_size
+            asset_id = job["file_info"]["assetId"]
+            entry = self.manifest.get(asset_id)
+            if not entry:
+                # Adopt files downloaded before the manifest existed
+                self.manifest.record(asset_id, self._manifest_path(filepath), size)
+            sha256 = entry["sha256"] if entry else None
+            self._record(
+                job, "skipped", "Skipped - Already exists", filename, {"size": size, "sha256": sha256}
+            )
+            return None
+
+        if not file_url:
+            reason = f" ({job['url_error']})" if job.get("url_error") else ""
+            self._log(f"  ✗ {label}: Could not fetch download URL{reason}")
+            self._record(job, "failed", "Failed - Could not fetch URL")
+            return None
+
+        filepath = self.output_dir / filename
+        return filename, filepath
+
+    def _finish_job(
+        self, job: Dict, filename: str, filepath: Path, result: Optional[Dict]
+    ) -> None:
+        """Report and record the outcome of a download."""
+        label = self._file_label(job)
+
+        # Lines are printed whole, once the file is done, so that messages
+        # from the thread fetching pages can't land in the middle of one
+        if result:
+            self._log(f"  ↓ {label}: Downloading... ✓")
+            self.manifest.record(
+                job["file_info"]["assetId"],
+                self._manifest_path(filepath),
+                result["size"],
+                result["sha256"],
+                urlparse(job["file_url"]).hostname,
+            )
+            self._record(job, "downloaded", "Downloaded", filename, result)
+        else:
+            self._log(f"  ✗ {label}: Download failed")
+            self._record(job, "failed", "Failed - Download error", filename)
+
+    def download_job(self, job: Dict) -> None:
+        """Download a single planned file, skipping it if it already exists."""
+        with self.profiler.phase("download"):
+            target = self._prepare_job(job)
+            if target is None:
+                return
+
+            filename, filepath = target
+            result = self._download_file(job, filepath)
+            self._finish_job(job, filename, filepath, result)
+
+    async def download_job_async(self, session: "aiohttp.ClientSession", job: Dict) -> None:
+        """Coroutine version of download_job for the async engine."""
+        with self.profiler.phase("download"):
+            target = await asyncio.to_thread(self._prepare_job, job)
+            if target is None:
+                return
+
+            filename, filepath = target
+            result = await self._download_file_async(session, job, filepath)
+            await asyncio.to_thread(self._finish_job, job, filename, filepath, result)
+
+    def download_practice_files(
+        self,
+        practice: Dict,
+        practice_number: int,
+        jobs: Optional[List[Dict]] = None,
+    ) -> None:
+        """Download all files for a single practice, one file at a time.
+
+        ``jobs`` are the practice's planned jobs with URLs already resolved.
+        If not given, they are planned and resolved here.
+        """
+        practice_name = practice.get("name", "Unknown")
+
+        self._log(f"\n[{practice_number:03d}_{practice_name}]")
+
+        if jobs is None:
+            jobs = self.plan_practice_files(practice, practice_number)
+            self.resolve_job_urls(jobs)
+
+        for job in jobs:
+            self.download_job(job)
+
+        if not jobs:
+            self._log("  (no files available)")
+
+    def _iter_practice_batches(self) -> Iterator[List[Tuple[Dict, int, List[Dict]]]]:
+        """Yield each page's practices with their planned jobs, URLs resolved."""
+        for practices in self.iter_practice_pages():
+            jobs = self._plan_page(practices)
+            self.resolve_job_urls(jobs)
+
+            jobs_by_practice = {}
+            for job in jobs:
+                jobs_by_practice.setdefault(job["practice_number"], []).append(job)
+
+            yield [
+                (practice, idx, jobs_by_practice.get(idx, []))
+                for idx, practice in practices
+            ]
+
+    def download_pipelined(self) -> None:
+        """Download the series with worker threads while pages are still being fetched.
+
+        Each board page is planned and resolved as soon as it arrives and its
+        jobs are fed to the workers through a bounded queue. When the queue
+        is full, fetching the next page waits, so memory stays flat however
+        large the series is. A single worker is handed whole practices, in
+        board order, so output stays grouped under each practice.
+        """
+        jobs_queue = queue.Queue(maxsize=self.workers * JOB_QUEUE_DEPTH)
+        errors = []
+
+        if self.sequential:
+            batches = self._iter_practice_batches()
+
+            def handle(task: Tuple[Dict, int, List[Dict]]) -> None:
+                self.download_practice_files(*task)
+        else:
+            batches = self._iter_job_batches()
+            handle = self.download_job
+
+        def worker() -> None:
+            while True:
+                task = jobs_queue.get()
+                try:
+                    if task is None:
+                        return
+                    # Once stopping, keep draining so the producer never blocks
+                    if not self._stopping.is_set():
+                        handle(task)
+                except BaseException as e:
+                    errors.append(e)
+                    self._stopping.set()
+                finally:
+                    jobs_queue.task_done()
+
+        threads = [
+            threading.Thread(target=worker, name=f"download-{n}", daemon=True)
+            for n in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
 
         try:
-            with open(csv_filepath, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = [
-                    "Practice Number",
-                    "Practice Name",
-                    "File Type",
-                    "Original Filename (Monday.com)",
-                    "Downloaded Filename",
-                    "Status",
-                    "File Size (MB)",
-                    "Timestamp"
-                ]
+            for tasks in batches:
+                if not self.sequential:
+                    self._log(f"Queueing {len(tasks)} files for {self.workers} workers...")
+                for task in tasks:
+                    jobs_queue.put(task)
+
+                if self._stopping.is_set():
+                    break
+        except BaseException:
+            # Interrupted or failed: workers abandon their transfers too
+            self._stopping.set()
+            raise
+        finally:
+            if self._stopping.is_set():
+                # Drop the queued work so there is room for the sentinels
+                while True:
+                    try:
+                        jobs_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    jobs_queue.task_done()
+            for _ in threads:
+                jobs_queue.put(None)
+            # No worker may touch the manifest or report after run() closes them
+            for thread in threads:
+                thread.join()
+
+        # A transfer abandoned because of the first error isn't worth reporting
+        errors = [e for e in errors if not isinstance(e, DownloadCancelled)] or errors
+        if errors:
+            raise errors[0]
+
+    def _connection_trace_config(self) -> "aiohttp.TraceConfig":
+        """Build an aiohttp trace config that counts connections per host."""
+
+        async def on_request_start(session, context, params):
+            context.host = params.url.host
+
+        def counter(key: str):
+            async def on_connection(session, context, params):
+                host_stats = self.async_connection_stats.setdefault(
+                    context.host, {"opened": 0, "reused": 0}
+                )
+                host_stats[key] += 1
+            return on_connection
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(counter("opened"))
+        trace_config.on_connection_reuseconn.append(counter("reused"))
+        return trace_config
+
+    def connection_stats(self) -> Dict[str, Dict[str, int]]:
+        """Connections opened and reused per host during this run."""
+        if self.engine == "async":
+            return self.async_connection_stats
+
+        stats = session_connection_stats(self.client.session)
+        for host, host_stats in session_connection_stats(self.session).items():
+            merged = stats.setdefault(host, {"opened": 0, "reused": 0})
+            merged["opened"] += host_stats["opened"]
+            merged["reused"] += host_stats["reused"]
+        return stats
+
+    def _download_all(self) -> bool:
+        """Fetch, plan and download the series with threads.
+
+        Returns False if the series has no practices.
+        """
+        self.download_pipelined()
+
+        if not self.series_size:
+            print(f"No practices found for series: {self.series_name}")
+            return False
+
+        return True
 
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
+    async def _download_all_async(self) -> bool:
+        """Fetch, plan and download the series on a single event loop.
 
-                for record in self.download_records:
-                    writer.writerow({
-                        "Practice Number": record["practice_number"],
-                        "Practice Name": record["practice_name"],
-                        "File Type": record["file_type"],
-                        "Original Filename (Monday.com)": record["original_filename"],
-                        "Downloaded Filename": record["downloaded_filename"],
-                        "Status": record["status"],
-                        "File Size (MB)": record["file_size_mb"],
-                        "Timestamp": record["timestamp"]
-                    })
+        Pages are planned as they arrive and fed through a bounded queue to
+        ``workers`` download tasks, which share one pooled aiohttp session
+        with the Monday.com API calls.
+        """
+        # Leave a little headroom in the pool for API calls
+        connector = aiohttp.TCPConnector(limit=self.workers * self.segments + 4)
+        async with aiohttp.ClientSession(
+            connector=connector, trace_configs=[self._connection_trace_config()]
+        ) as session:
+            client = AsyncMondayAPIClient(
+                self.client.api_token,
+                session,
+                budget=self.client.budget,
+                retry_policy=self.retry_policy,
+            )
+            jobs_queue = asyncio.Queue(maxsize=self.workers * JOB_QUEUE_DEPTH)
+            errors = []
+
+            async def worker() -> None:
+                while True:
+                    job = await jobs_queue.get()
+                    try:
+                        if job is None:
+                            return
+                        # After a failure keep draining so the producer never blocks
+                        if not errors:
+                            await self.download_job_async(session, job)
+                    except Exception as e:
+                        errors.append(e)
+                    finally:
+                        jobs_queue.task_done()
+
+            tasks = [asyncio.create_task(worker()) for _ in range(self.workers)]
+
+            try:
+                async for jobs in self._iter_job_batches_async(client):
+                    self._log(
+                        f"Queueing {len(jobs)} files for up to {self.workers} concurrent transfers..."
+                    )
+                    for job in jobs:
+                        await jobs_queue.put(job)
+
+                    if errors:
+                        break
+
+                for _ in tasks:
+                    await jobs_queue.put(None)
+
+                await asyncio.gather(*tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+            if errors:
+                raise errors[0]
+
+        if not self.series_size:
+            print(f"No practices found for series: {self.series_name}")
+            return False
 
-            print(f"\n✓ Download report saved: {csv_filepath.name}")
+        return True
 
-        except Exception as e:
-            print(f"\n✗ Error generating CSV report: {e}")
+    def run(self) -> None:
+        """Main download process."""
+        print(f"Downloading files to: {self.output_dir}")
+        if self.limiter.rate:
+            print(f"Bandwidth limit: {self.limiter.rate / (1024 * 1024):.2f} MB/s")
+        if self.metrics and self.metrics.port is not None:
+            print(f"Metrics: http://127.0.0.1:{self.metrics.port}/metrics")
+        print("=" * 60)
+
+        if self.metrics:
+            self.metrics.start(self)
+        self.profiler.start()
+        try:
+            if self.engine == "async":
+                found = asyncio.run(self._download_all_async())
+            else:
+                found = self._download_all()
+
+            if not found:
+                return
+
+            # Print summary
+            self.print_summary()
+
+            if self.incremental:
+                self._save_snapshot()
+        finally:
+            # Rows are already on disk; this reports where, even after a crash
+            self.close_report()
+            self.manifest.close()
+            if self.metrics:
+                self.metrics.stop()
+            self.profiler.stop()
+
+    def series_stats(self) -> Dict[str, Dict[str, int]]:
+        """File counts and bytes of each series in the run, by series name."""
+        return {self.series_name: self.stats}
+
+    def close_report(self) -> None:
+        """Close the CSV report and say where it was saved."""
+        self.report.close()
+        if self.report.error:
+            print(f"\n✗ Error writing CSV report: {self.report.error}")
+        elif self.report.rows:
+            print(f"\n✓ Download report saved: {self.report.path.name}")
 
     def print_summary(self) -> None:
         """Print download summary."""
@@ -442,8 +3595,310 @@ class PracticeDownloader:
         print(f"Downloaded:            {self.stats['downloaded']}")
         print(f"Skipped (exist):       {self.stats['skipped']}")
         print(f"Failed:                {self.stats['failed']}")
+
+        self._print_usage()
         print(f"\nFiles saved to: {self.output_dir.absolute()}")
 
+    def _print_usage(self) -> None:
+        """Print API usage, connections and stage timings for the summary."""
+        budget = self.client.budget
+        if budget.used:
+            print(f"\nAPI complexity used:   {budget.used:,}")
+            print(f"Budget waits:          {budget.waits}")
+
+        retries = self.retry_policy.retries
+        if any(retries.values()):
+            print(f"Retries (API / files): {retries['api']} / {retries['download']}")
+
+        connection_stats = self.connection_stats()
+        if connection_stats:
+            print("\nConnections (opened / reused):")
+            for host, host_stats in sorted(connection_stats.items()):
+                print(f"  {host:<40} {host_stats['opened']} / {host_stats['reused']}")
+
+        self._print_timings()
+
+    def _print_timings(self) -> None:
+        """Print percentiles of how long each stage of the run took."""
+        rows = []
+        for stage, label in TIMED_STAGES.items():
+            percentiles = self.timings.percentiles(stage)
+            if percentiles:
+                values = " / ".join(f"{seconds:.3f}s" for seconds in percentiles)
+                rows.append(f"  {label:<20}{values}  ({len(self.timings.samples[stage])})")
+
+        if rows:
+            header = " / ".join(f"p{percent}" for percent in TIMING_PERCENTILES)
+            print(f"\nStage timings ({header}, samples):")
+            for row in rows:
+                print(row)
+
+
+class MultiSeriesDownloader(PracticeDownloader):
+    """Downloads several series from a single scan of the board.
+
+    Board pages are bucketed by group title into one PracticeDownloader per
+    series. Their files all go through this downloader's engine, HTTP
+    sessions and manifest. Each series keeps its own folder, stats and
+    snapshot, and its own CSV report unless ``single_report`` is set.
+    """
+
+    def __init__(
+        self,
+        api_token: str,
+        series_list: List[str],
+        output_dir: str = "practice_files",
+        workers: int = 1,
+        engine: str = "threads",
+        extra_columns: Optional[List[str]] = None,
+        incremental: bool = False,
+        limiter: Optional[BandwidthLimiter] = None,
+        segments: int = DOWNLOAD_SEGMENTS,
+        single_report: bool = False,
+        timings: Optional[StageTimings] = None,
+        profiler: Optional[RunProfiler] = None,
+        metrics: Optional[MetricsExporter] = None,
+    ):
+        self.single_report = single_report
+        report = None
+        if single_report:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            report = ReportWriter(Path(output_dir) / f"download_report_{timestamp}.csv")
+        super().__init__(
+            api_token,
+            "all",
+            output_dir=output_dir,
+            workers=workers,
+            engine=engine,
+            extra_columns=extra_columns,
+            incremental=incremental,
+            limiter=limiter,
+            segments=segments,
+            report=report,
+            timings=timings,
+            profiler=profiler,
+            metrics=metrics,
+        )
+        self.series_name = ", ".join(SERIES_MAP.get(series, series) for series in series_list)
+        self.output_dir = self.root_dir
+        # Pages mix series, so files are always listed one per line
+        self.sequential = False
+
+        self.downloaders = []
+        for series in series_list:
+            downloader = PracticeDownloader(
+                api_token,
+                series,
+                output_dir=output_dir,
+                workers=workers,
+                engine=engine,
+                extra_columns=extra_columns,
+                incremental=incremental,
+                client=self.client,
+                session=self.session,
+                manifest=self.manifest,
+                limiter=self.limiter,
+                segments=segments,
+                report=report,
+                timings=self.timings,
+                profiler=self.profiler,
+            )
+            downloader.sequential = False
+            downloader.label_prefix = f"{downloader.series_name} / "
+            downloader._lock = self._lock
+            downloader._stopping = self._stopping
+            self.downloaders.append(downloader)
+
+    def _split_series(self, group_ids: Dict[str, str]) -> Tuple[List, List]:
+        """Split the series into those that can sync incrementally and those to scan.
+
+        Series with no group on the board are reported and left out.
+        """
+        incremental, scan = [], []
+
+        for downloader in self.downloaders:
+            downloader.group_id = group_ids.get(downloader.series_name)
+            if not downloader.group_id:
+                self._log(f"✗ No group named '{downloader.series_name}' on the board")
+                continue
+
+            snapshot = downloader._load_snapshot(downloader.group_id) if self.incremental else None
+            if snapshot:
+                incremental.append((downloader, snapshot))
+            else:
+                scan.append(downloader)
+
+        return incremental, scan
+
+    def _changes_query_params(self, incremental: List) -> Dict:
+        """Build one items_page filter covering every series' last sync."""
+        oldest = min(incremental, key=lambda pair: pair[1]["synced_at"])
+        return self._changed_since_params(oldest[1])
+
+    def _plan_changes(
+        self,
+        incremental: List,
+        scan: List,
+        sync_started: str,
+        changed_items: List[Dict],
+        listing: List[Dict],
+    ) -> List[Dict]:
+        """Plan the changed practices of each incrementally synced series.
+
+        ``changed_items`` and ``listing`` come from _fetch_changes over the
+        whole board. Series whose membership changed are added to ``scan``
+        instead.
+        """
+        jobs = []
+
+        for downloader, snapshot in incremental:
+            practices = downloader._sync_changes(snapshot, sync_started, changed_items, listing)
+            if practices is None:
+                scan.append(downloader)
+                continue
+
+            jobs.extend(self._plan_series_jobs(downloader, practices))
+
+        return jobs
+
+    def _plan_series_jobs(
+        self, downloader: PracticeDownloader, practices: List[Tuple[int, Dict]]
+    ) -> List[Dict]:
+        """Plan a series' practices, tagging each job with its downloader."""
+        if practices:
+            downloader.output_dir.mkdir(parents=True, exist_ok=True)
+
+        jobs = downloader.plan_jobs(practices)
+        for job in jobs:
+            job["downloader"] = downloader
+        return jobs
+
+    def _plan_board_page(self, scan: List, items: List[Dict], page: int) -> List[Dict]:
+        """Bucket one page of board items into the scanned series and plan them."""
+        by_title = {}
+        for item in items:
+            by_title.setdefault(item.get("group", {}).get("title"), []).append(item)
+
+        jobs = []
+        counts = []
+        for downloader in scan:
+            practices = downloader._number_practices(by_title.get(downloader.series_name, []))
+            jobs.extend(self._plan_series_jobs(downloader, practices))
+            counts.append(f"{downloader.series_name}: {downloader.series_size}")
+
+        self._log(f"Page {page}: Fetched {len(items)} items ({', '.join(counts)})")
+        return jobs
+
+    def _finish_board_scan(self, scan: List, sync_started: str) -> None:
+        """Wrap up the full scan of every scanned series."""
+        for downloader in scan:
+            self._log(f"✓ {downloader.series_name}: {downloader.series_size} practices")
+            downloader._finish_scan(sync_started)
+
+    def _start_board_scan(self, scan: List) -> None:
+        """Reset the practice count of every series about to be scanned."""
+        for downloader in scan:
+            downloader._start_scan()
+
+    def _iter_job_batches(self) -> Iterator[List[Dict]]:
+        """Yield planned jobs for all series, with URLs resolved, a page at a time."""
+        sync_started = self._begin_sync()
+        incremental, scan = self._split_series(self.client.fetch_group_ids(BOARD_ID))
+
+        if incremental:
+            changes = self._fetch_changes(self._changes_query_params(incremental))
+            jobs = self._plan_changes(incremental, scan, sync_started, *changes)
+            self.resolve_job_urls(jobs)
+            if jobs:
+                yield jobs
+
+        if scan:
+            # One pass over the whole board feeds every scanned series
+            self._start_board_scan(scan)
+            for page, items in enumerate(self._iter_board_pages(), start=1):
+                jobs = self._plan_board_page(scan, items, page)
+                self.resolve_job_urls(jobs)
+                yield jobs
+            self._finish_board_scan(scan, sync_started)
+
+        self.series_size = sum(downloader.series_size for downloader in self.downloaders)
+
+    async def _iter_job_batches_async(self, client: AsyncMondayAPIClient) -> AsyncIterator[List[Dict]]:
+        """Coroutine version of _iter_job_batches for the async engine."""
+        sync_started = self._begin_sync()
+        incremental, scan = self._split_series(await client.fetch_group_ids(BOARD_ID))
+
+        if incremental:
+            changes = await self._fetch_changes_async(client, self._changes_query_params(incremental))
+            jobs = await asyncio.to_thread(self._plan_changes, incremental, scan, sync_started, *changes)
+            await self.resolve_job_urls_async(client, jobs)
+            if jobs:
+                yield jobs
+
+        if scan:
+            self._start_board_scan(scan)
+            page = 1
+            async for items in self._iter_board_pages_async(client):
+                jobs = await asyncio.to_thread(self._plan_board_page, scan, items, page)
+                await self.resolve_job_urls_async(client, jobs)
+                yield jobs
+                page += 1
+            self._finish_board_scan(scan, sync_started)
+
+        self.series_size = sum(downloader.series_size for downloader in self.downloaders)
+
+    def _jobs_needing_urls(self, jobs: List[Dict]) -> List[Dict]:
+        """Select the jobs whose files are missing, checked in their own series."""
+        return [job for job in jobs if job["downloader"]._jobs_needing_urls([job])]
+
+    def download_job(self, job: Dict) -> None:
+        """Hand a job to the downloader of its series."""
+        job["downloader"].download_job(job)
+
+    async def download_job_async(self, session: "aiohttp.ClientSession", job: Dict) -> None:
+        """Hand a job to the downloader of its series."""
+        await job["downloader"].download_job_async(session, job)
+
+    def _save_snapshot(self) -> None:
+        """Save each series' snapshot."""
+        for downloader in self.downloaders:
+            downloader._save_snapshot()
+
+    def series_stats(self) -> Dict[str, Dict[str, int]]:
+        """File counts and bytes of each series in the run, by series name."""
+        return {downloader.series_name: downloader.stats for downloader in self.downloaders}
+
+    def close_report(self) -> None:
+        """Close the combined report, or the report in each series' folder."""
+        if self.single_report:
+            super().close_report()
+            return
+        for downloader in self.downloaders:
+            downloader.close_report()
+
+    def print_summary(self) -> None:
+        """Print a download summary per series and in total."""
+        for key in self.stats:
+            self.stats[key] = sum(downloader.stats[key] for downloader in self.downloaders)
+
+        print("\n" + "=" * 60)
+        print("DOWNLOAD SUMMARY")
+        print("=" * 60)
+        print(f"{'Series':<24}{'Found':>8}{'Downloaded':>12}{'Skipped':>9}{'Failed':>8}")
+        for downloader in self.downloaders:
+            stats = downloader.stats
+            print(
+                f"{downloader.series_name:<24}{stats['total_files']:>8}"
+                f"{stats['downloaded']:>12}{stats['skipped']:>9}{stats['failed']:>8}"
+            )
+        print(
+            f"{'Total':<24}{self.stats['total_files']:>8}"
+            f"{self.stats['downloaded']:>12}{self.stats['skipped']:>9}{self.stats['failed']:>8}"
+        )
+
+        self._print_usage()
+        print(f"\nFiles saved to: {self.root_dir.absolute()}")
+
 
 def main():
     """Main entry point."""
@@ -464,14 +3919,22 @@ Series options:
 Example usage:
   python3 download_practices.py --series high_school_core --token YOUR_TOKEN
   python3 download_practices.py --series middle_school_core --token YOUR_TOKEN --output ~/Documents/IE
+  python3 download_practices.py --series high_school_core --token YOUR_TOKEN --workers 8
+  python3 download_practices.py --series high_school_core --token YOUR_TOKEN --engine async --workers 64
+  python3 download_practices.py --series high_school_core middle_school_core --token YOUR_TOKEN
+  python3 download_practices.py --series all --token YOUR_TOKEN --workers 8 --incremental
+  python3 download_practices.py --series all --token YOUR_TOKEN --workers 8 --max-rate 20MB/s
+  python3 download_practices.py --series all --token YOUR_TOKEN --workers 8 --profile cpu --profile-stacks
         """,
     )
 
     parser.add_argument(
         "--series",
         required=True,
-        choices=list(SERIES_MAP.keys()),
-        help="Practice series to download",
+        nargs="+",
+        choices=list(SERIES_MAP.keys()) + ["all"],
+        help="Practice series to download; give several, or 'all', to fetch "
+        "them from a single scan of the board",
     )
 
     parser.add_argument(
@@ -486,14 +3949,124 @@ Example usage:
         help="Output directory for downloaded files (default: practice_files)",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of files to download at the same time (default: 1)",
+    )
+
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only re-check practices changed on Monday.com since the last "
+        "--incremental run",
+    )
+
+    parser.add_argument(
+        "--engine",
+        choices=["threads", "async"],
+        default="threads",
+        help="Download engine: worker threads, or asyncio (requires aiohttp) "
+        "for many concurrent transfers (default: threads)",
+    )
+
+    parser.add_argument(
+        "--single-report",
+        action="store_true",
+        help="With several series, write one CSV report for all of them in "
+        "the output directory instead of one per series folder",
+    )
+
+    parser.add_argument(
+        "--metrics-file",
+        help="Write Prometheus metrics to this file during and after the run, "
+        "e.g. for node_exporter's textfile collector",
+    )
+
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        help="Serve OpenMetrics at http://127.0.0.1:PORT/metrics while running",
+    )
+
+    parser.add_argument(
+        "--profile",
+        choices=["cpu", "mem"],
+        help="Profile the run: cpu saves cProfile stats for pstats or "
+        "snakeviz; mem reports peak traced memory per phase. Results go in "
+        "the output directory",
+    )
+
+    parser.add_argument(
+        "--profile-stacks",
+        action="store_true",
+        help="With --profile cpu, also save sampled stacks in the collapsed "
+        "format flame graph tools read",
+    )
+
+    parser.add_argument(
+        "--segments",
+        type=int,
+        default=DOWNLOAD_SEGMENTS,
+        help="Byte ranges to fetch at once for files of "
+        f"{SEGMENT_THRESHOLD // (1024 * 1024)}MB or more; 1 turns this off "
+        f"(default: {DOWNLOAD_SEGMENTS})",
+    )
+
+    parser.add_argument(
+        "--max-rate",
+        help="Cap the combined download rate of all workers, e.g. 20MB/s or "
+        "512KB/s (default: no limit)",
+    )
+
+    parser.add_argument(
+        "--max-rate-file",
+        help="File holding a rate like --max-rate's; edit it while running "
+        "to change the limit",
+    )
+
     args = parser.parse_args()
 
+    if args.engine == "async" and aiohttp is None:
+        parser.error("--engine async requires aiohttp (pip3 install aiohttp)")
+
+    if args.profile_stacks and args.profile != "cpu":
+        parser.error("--profile-stacks requires --profile cpu")
+
     try:
-        downloader = PracticeDownloader(
-            api_token=args.token,
-            series=args.series,
-            output_dir=args.output,
-        )
+        max_rate = parse_rate(args.max_rate) if args.max_rate else None
+    except ValueError as e:
+        parser.error(str(e))
+
+    if "all" in args.series:
+        series_list = list(SERIES_MAP.keys())
+    else:
+        series_list = list(dict.fromkeys(args.series))
+
+    # Built once here and shared by every series in the run
+    metrics = None
+    if args.metrics_file or args.metrics_port is not None:
+        metrics = MetricsExporter(args.metrics_file, args.metrics_port)
+    options = {
+        "output_dir": args.output,
+        "workers": args.workers,
+        "engine": args.engine,
+        "incremental": args.incremental,
+        "segments": args.segments,
+        "limiter": BandwidthLimiter(max_rate, args.max_rate_file),
+        "timings": StageTimings(),
+        "profiler": RunProfiler(args.profile, args.profile_stacks, Path(args.output)),
+        "metrics": metrics,
+    }
+
+    try:
+        if len(series_list) > 1:
+            downloader = MultiSeriesDownloader(
+                args.token, series_list, single_report=args.single_report, **options
+            )
+        else:
+            downloader = PracticeDownloader(args.token, series_list[0], **options)
         downloader.run()
     except KeyboardInterrupt:
         print("\n\nDownload interrupted by user.")
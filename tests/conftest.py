@@ -0,0 +1,16 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from download_practices import PracticeDownloader  # noqa: E402
+
+
+@pytest.fixture
+def downloader(tmp_path):
+    """A High School Core downloader writing under a temporary directory."""
+    downloader = PracticeDownloader("test", "high_school_core", output_dir=str(tmp_path))
+    yield downloader
+    downloader.manifest.close()
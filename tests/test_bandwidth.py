@@ -0,0 +1,30 @@
+import pytest
+
+from download_practices import parse_rate
+
+
+@pytest.mark.parametrize(
+    "value, rate",
+    [
+        ("20MB/s", 20 * 1024 ** 2),
+        ("512KB/s", 512 * 1024),
+        ("512K", 512 * 1024),
+        ("1.5M", 1.5 * 1024 ** 2),
+        ("2GiB/s", 2 * 1024 ** 3),
+        ("1000", 1000),
+        (" 20 mb/s\n", 20 * 1024 ** 2),
+    ],
+)
+def test_rates(value, rate):
+    assert parse_rate(value) == rate
+
+
+@pytest.mark.parametrize("value", ["0", "off", "OFF", "none", "unlimited", "", "0MB/s"])
+def test_no_limit(value):
+    assert parse_rate(value) is None
+
+
+@pytest.mark.parametrize("value", ["fast", "20TB/s", "-5MB/s", "20MB/min", "1.5.2M"])
+def test_invalid_rates(value):
+    with pytest.raises(ValueError, match="Invalid rate"):
+        parse_rate(value)
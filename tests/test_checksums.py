@@ -0,0 +1,76 @@
+import base64
+import hashlib
+
+import pytest
+
+from download_practices import ChecksumMismatch, FileDigest
+
+BODY = b"practice audio"
+MD5 = hashlib.md5(BODY).hexdigest()
+SHA256 = hashlib.sha256(BODY).hexdigest()
+
+
+def b64(hexdigest):
+    return base64.b64encode(bytes.fromhex(hexdigest)).decode()
+
+
+def test_no_checksum_headers():
+    assert FileDigest.expected_checksums({"ETag": '"abc-1"'}) == {}
+
+
+def test_s3_etag_is_the_md5():
+    assert FileDigest.expected_checksums({"ETag": f'"{MD5.upper()}"'}) == {"md5": MD5}
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"ETag": f'"{MD5[:24]}-3"'},
+        {"ETag": f'W/"{MD5}"'},
+        {"ETag": f'"{MD5}"', "x-amz-server-side-encryption": "aws:kms"},
+        {"ETag": f'"{MD5}"', "x-amz-server-side-encryption-customer-algorithm": "AES256"},
+    ],
+    ids=["multipart", "weak", "kms", "customer key"],
+)
+def test_etags_that_are_not_the_md5(headers):
+    assert FileDigest.expected_checksums(headers) == {}
+
+
+def test_digest_headers():
+    headers = {
+        "x-amz-checksum-sha256": b64(SHA256),
+        "x-goog-hash": f"crc32c=AAAAAA==,md5={b64(MD5)}",
+    }
+
+    assert FileDigest.expected_checksums(headers) == {"sha256": SHA256, "md5": MD5}
+
+
+def test_content_md5():
+    assert FileDigest.expected_checksums({"Content-MD5": b64(MD5)}) == {"md5": MD5}
+
+
+def test_malformed_digest_is_ignored():
+    assert FileDigest.expected_checksums({"Content-MD5": "not base64!"}) == {}
+
+
+def test_range_responses_only_trust_the_etag():
+    # Content-MD5 and friends describe just the bytes sent in a range
+    headers = {"ETag": f'"{MD5}"', "Content-MD5": b64(hashlib.md5(BODY[5:]).hexdigest())}
+
+    assert FileDigest.expected_checksums(headers, partial=True) == {"md5": MD5}
+
+
+def test_verify_passes_and_lists_the_checks():
+    digest = FileDigest({"ETag": f'"{MD5}"', "x-amz-checksum-sha256": b64(SHA256)})
+    digest.update(BODY)
+
+    assert digest.verify() == ["md5", "sha256"]
+    assert digest.hexdigest() == SHA256
+
+
+def test_verify_raises_on_a_mismatch():
+    digest = FileDigest({"Content-MD5": b64(MD5)})
+    digest.update(BODY + b"!")
+
+    with pytest.raises(ChecksumMismatch, match="MD5 mismatch"):
+        digest.verify()
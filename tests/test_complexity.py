@@ -0,0 +1,65 @@
+import time
+
+import pytest
+
+from download_practices import ComplexityBudget
+
+PAGE = "query page"
+ASSETS = "query assets"
+
+
+def budget_after(query, before, cost, reset_in=60):
+    """A budget that has seen one response to ``query``."""
+    budget = ComplexityBudget()
+    budget.update(query, {"before": before, "query": cost, "after": before - cost, "reset_in_x_seconds": reset_in})
+    return budget
+
+
+def test_unknown_budget_never_waits():
+    budget = ComplexityBudget()
+
+    assert budget.reserve(PAGE) == 0.0
+    assert budget.requests == 1
+    assert budget.waits == 0
+
+
+def test_known_cost_is_set_aside():
+    budget = budget_after(PAGE, 1000, 100)
+
+    assert budget.reserve(PAGE) == 0.0
+    assert budget.remaining == 800
+
+
+def test_query_the_budget_cannot_cover_waits_for_the_reset():
+    budget = budget_after(PAGE, 1000, 600, reset_in=30)
+
+    delay = budget.reserve(PAGE)
+
+    assert 29 < delay <= 30
+    assert budget.remaining == 400
+    assert budget.waits == 1
+
+
+def test_unseen_query_is_assumed_to_cost_the_most():
+    budget = budget_after(PAGE, 1000, 300)
+    budget.update(ASSETS, {"before": 700, "query": 50, "after": 650, "reset_in_x_seconds": 60})
+
+    assert budget.reserve("query groups") == 0.0
+    assert budget.remaining == 350
+
+
+def test_budget_refills_when_the_window_resets():
+    budget = budget_after(PAGE, 1000, 600)
+    budget.reset_at = time.monotonic() - 1
+
+    assert budget.reserve(PAGE) == 0.0
+    assert budget.remaining == 400
+    assert budget.reset_at > time.monotonic()
+
+
+def test_rejected_query_waits_out_retry_in():
+    budget = budget_after(PAGE, 1000, 10, reset_in=5)
+    budget.exhausted(20)
+
+    assert budget.reserve(PAGE) == pytest.approx(20, abs=1)
+    assert budget.waits == 2
@@ -0,0 +1,73 @@
+import pytest
+
+from download_practices import ContentSniffer, UnexpectedContent
+
+
+@pytest.mark.parametrize(
+    "head",
+    [
+        b"ID3\x04\x00\x00\x00\x00\x00\x00",
+        b"\xff\xfb\x90\x64\x00\x00\x00\x00",
+        b"\xff\xf3\x84\x44\x00\x00\x00\x00",
+        b"RIFF\x24\x08\x00\x00WAVE",
+        b"fLaC\x00\x00\x00\x22",
+        b"OggS\x00\x02\x00\x00",
+        b"\x00\x00\x00\x20ftypM4A ",
+    ],
+    ids=["id3", "mpeg", "mpeg v2", "wav", "flac", "ogg", "m4a"],
+)
+def test_audio(head):
+    assert ContentSniffer.matches("audio", head)
+
+
+@pytest.mark.parametrize(
+    "head",
+    [
+        b"\xff\xd8\xff\xe0\x00\x10JFIF",
+        b"\x89PNG\r\n\x1a\n\x00\x00",
+        b"GIF89a\x01\x00",
+        b"RIFF\x24\x08\x00\x00WEBP",
+    ],
+    ids=["jpeg", "png", "gif", "webp"],
+)
+def test_images(head):
+    assert ContentSniffer.matches("image", head)
+
+
+@pytest.mark.parametrize(
+    "kind, head",
+    [
+        ("audio", b"<!DOCTYPE html>"),
+        ("audio", b"\xff\xd8\xff\xe0\x00\x10JFIF"),
+        ("audio", b"\xff"),
+        ("image", b"ID3\x04\x00\x00\x00"),
+        ("image", b'<?xml version="1.0"?><Error>'),
+        ("image", b""),
+    ],
+    ids=["html for audio", "jpeg for audio", "one byte", "mp3 for image", "s3 error", "empty"],
+)
+def test_mismatches(kind, head):
+    assert not ContentSniffer.matches(kind, head)
+
+
+def test_sniffer_raises_on_an_error_page():
+    sniffer = ContentSniffer("audio")
+
+    with pytest.raises(UnexpectedContent, match="HTML/XML page") as error:
+        sniffer.feed(b"\xef\xbb\xbf\n<html><body>Access denied</body></html>")
+    assert error.value.markup
+
+
+def test_sniffer_checks_short_files_when_asked():
+    sniffer = ContentSniffer("image")
+    sniffer.feed(b"ID3")
+
+    with pytest.raises(UnexpectedContent, match="a file starting 49 44 33") as error:
+        sniffer.check()
+    assert not error.value.markup
+
+
+def test_sniffer_ignores_kinds_without_signatures():
+    sniffer = ContentSniffer(None)
+    sniffer.feed(b"<html>")
+    sniffer.check()
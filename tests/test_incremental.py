@@ -0,0 +1,90 @@
+GROUP = "group_hs"
+OTHER_GROUP = "group_ms"
+
+
+def item(item_id, group_id=GROUP, updated_at="2026-10-01T00:00:00Z"):
+    return {"id": item_id, "name": f"Practice {item_id}", "updated_at": updated_at, "group": {"id": group_id}}
+
+
+def snapshot(*item_ids):
+    return {
+        "group_id": GROUP,
+        "synced_at": "2026-10-01T12:00:00+00:00",
+        "items": [item(item_id) for item_id in item_ids],
+    }
+
+
+def test_changed_items_keep_their_numbers(downloader):
+    current = snapshot("1", "2", "3")
+    changed = item("2", updated_at="2026-10-02T00:00:00Z")
+
+    practices = downloader._incremental_practices(current, GROUP, [changed], ["1", "2", "3"])
+
+    assert practices == [(2, changed)]
+    assert current["items"][1] is changed
+    assert downloader.series_size == 3
+
+
+def test_unchanged_items_are_skipped(downloader):
+    practices = downloader._incremental_practices(
+        snapshot("1", "2"), GROUP, [item("1"), item("2")], ["1", "2"]
+    )
+
+    assert practices == []
+
+
+def test_changes_in_other_series_are_ignored(downloader):
+    practices = downloader._apply_changes(
+        snapshot("1", "2"), [item("9", OTHER_GROUP, "2026-10-02T00:00:00Z")], GROUP
+    )
+
+    assert practices == []
+
+
+def test_added_item_needs_a_full_scan(downloader):
+    assert downloader._incremental_practices(
+        snapshot("1", "2"), GROUP, [item("3")], ["1", "2", "3"]
+    ) is None
+
+
+def test_removed_item_needs_a_full_scan(downloader):
+    # Deleted items never show up as changed, only missing from the listing
+    assert downloader._incremental_practices(snapshot("1", "2", "3"), GROUP, [], ["1", "3"]) is None
+
+
+def test_reordered_items_need_a_full_scan(downloader):
+    assert downloader._incremental_practices(snapshot("1", "2", "3"), GROUP, [], ["2", "1", "3"]) is None
+
+
+def test_item_moved_out_needs_a_full_scan(downloader):
+    moved = item("2", OTHER_GROUP, "2026-10-02T00:00:00Z")
+
+    assert downloader._apply_changes(snapshot("1", "2"), [moved], GROUP) is None
+
+
+def test_item_moved_in_needs_a_full_scan(downloader):
+    moved = item("9", updated_at="2026-10-02T00:00:00Z")
+
+    assert downloader._apply_changes(snapshot("1", "2"), [moved], GROUP) is None
+
+
+def test_sync_changes_keeps_the_snapshot_for_saving(downloader):
+    downloader.group_id = GROUP
+    current = snapshot("1", "2")
+    changed = item("1", updated_at="2026-10-02T00:00:00Z")
+    listing = [item("1"), item("7", OTHER_GROUP), item("2")]
+
+    practices = downloader._sync_changes(current, "2026-10-03T00:00:00+00:00", [changed], listing)
+
+    assert practices == [(1, changed)]
+    assert downloader._pending_snapshot is current
+    assert current["synced_at"] == "2026-10-03T00:00:00+00:00"
+
+
+def test_sync_changes_leaves_the_snapshot_when_rescanning(downloader):
+    downloader.group_id = GROUP
+    current = snapshot("1", "2")
+
+    assert downloader._sync_changes(current, "2026-10-03T00:00:00+00:00", [], [item("1")]) is None
+    assert downloader._pending_snapshot is None
+    assert current["synced_at"] == "2026-10-01T12:00:00+00:00"
@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+from download_practices import PracticeDownloader
+
+
+def write_part(downloader, name, data, **info):
+    """Leave a partial download, with its sidecar, as an interrupted run would."""
+    downloader.output_dir.mkdir(parents=True, exist_ok=True)
+    part_path = downloader._part_path(downloader.output_dir / name)
+    part_path.write_bytes(data)
+    if info:
+        downloader._part_info_path(part_path).write_text(json.dumps(info))
+    return part_path
+
+
+def test_part_of_the_same_asset_resumes(downloader):
+    part_path = write_part(downloader, "a.mp3", b"x" * 100, asset_id="42", validator='"v1"')
+
+    assert downloader._open_part(part_path, 42) == (100, '"v1"')
+    assert part_path.exists()
+
+
+@pytest.mark.parametrize(
+    "info",
+    [
+        {"asset_id": "7", "validator": '"v1"'},
+        {"asset_id": "42", "validator": '"v1"', "segmented": True},
+        {},
+    ],
+    ids=["other asset", "segmented", "no sidecar"],
+)
+def test_part_that_cannot_be_trusted_is_discarded(downloader, info):
+    part_path = write_part(downloader, "a.mp3", b"x" * 100, **info)
+
+    assert downloader._open_part(part_path, 42) == (0, None)
+    assert not part_path.exists()
+    assert not downloader._part_info_path(part_path).exists()
+
+
+def test_range_headers_carry_the_validator():
+    assert PracticeDownloader._range_headers(0, '"v1"') == {}
+    assert PracticeDownloader._range_headers(100, '"v1"') == {"Range": "bytes=100-", "If-Range": '"v1"'}
+    assert PracticeDownloader._range_headers(100, None) == {"Range": "bytes=100-"}
+
+
+def test_partial_response_continues_the_part():
+    headers = {"Content-Range": "bytes 100-999/1000", "Content-Length": "900"}
+
+    assert PracticeDownloader._resume_point(206, headers, 100) == (100, 1000)
+
+
+def test_partial_response_of_unknown_size():
+    assert PracticeDownloader._resume_point(206, {"Content-Range": "bytes 100-999/*"}, 100) == (100, None)
+
+
+def test_partial_response_at_the_wrong_offset_is_rejected():
+    with pytest.raises(Exception, match="Unexpected Content-Range"):
+        PracticeDownloader._resume_point(206, {"Content-Range": "bytes 0-999/1000"}, 100)
+
+
+def test_full_response_to_if_range_restarts_from_zero():
+    # The file changed, so If-Range made the server send all of it
+    assert PracticeDownloader._resume_point(200, {"Content-Length": "1200"}, 100) == (0, 1200)
+
+
+def test_encoded_response_has_no_known_size():
+    headers = {"Content-Length": "500", "Content-Encoding": "gzip"}
+
+    assert PracticeDownloader._resume_point(200, headers, 0) == (0, None)
+
+
+def test_unsatisfiable_range_promotes_a_complete_part(downloader):
+    filepath = downloader.output_dir / "a.mp3"
+    part_path = write_part(downloader, "a.mp3", b"x" * 100, asset_id="42", validator='"v1"')
+
+    result = downloader._unsatisfiable(part_path, filepath, 100, {"Content-Range": "bytes */100"})
+
+    assert result["size"] == 100
+    assert result["verified"] == ["length"]
+    assert filepath.read_bytes() == b"x" * 100
+    assert not part_path.exists()
+    assert not downloader._part_info_path(part_path).exists()
+
+
+def test_unsatisfiable_range_of_another_size_starts_over(downloader):
+    filepath = downloader.output_dir / "a.mp3"
+    part_path = write_part(downloader, "a.mp3", b"x" * 100, asset_id="42", validator='"v1"')
+
+    assert downloader._unsatisfiable(part_path, filepath, 100, {"Content-Range": "bytes */80"}) is None
+    assert not part_path.exists()
+    assert not filepath.exists()